@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Optional, List, Dict
 
+from . import json_codec
+
 
 class AgentRegistry:
     PIPELINE_STAGES = ["intent", "context", "spec", "plan", "tasks", "implementation", "feedback"]
@@ -77,13 +78,11 @@ class AgentRegistry:
                 self._persist()
             return default
 
-        with self.registry_path.open("r") as f:
-            return json.load(f)
+        return json_codec.loads(self.registry_path.read_bytes())
 
     def _persist(self) -> None:
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.registry_path.open("w") as f:
-            json.dump(self._registry, f, indent=2)
+        self.registry_path.write_bytes(json_codec.dumps(self._registry))
 
 
 def _default_registry_path() -> Path:
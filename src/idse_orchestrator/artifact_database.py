@@ -1,16 +1,50 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from hashlib import sha256
 import json
 from pathlib import Path
 import sqlite3
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 
 
 DEFAULT_DB_NAME = "idse.db"
 
+_UPSERT_ARTIFACT_SQL = """
+    INSERT INTO artifacts (
+        project_id,
+        session_id,
+        stage,
+        idse_id,
+        content,
+        content_hash,
+        semantic_fingerprint,
+        created_at,
+        updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(session_id, stage)
+    DO UPDATE SET
+        idse_id = excluded.idse_id,
+        content = excluded.content,
+        content_hash = excluded.content_hash,
+        semantic_fingerprint = excluded.semantic_fingerprint,
+        updated_at = excluded.updated_at;
+"""
+
+# Artifact rows joined with their project and session names; callers append
+# the stage filter and terminating semicolon.
+_SELECT_ARTIFACTS_SQL = """
+    SELECT p.name AS project, s.session_id, a.stage, a.idse_id, a.content,
+           a.content_hash, a.semantic_fingerprint, a.created_at, a.updated_at
+    FROM artifacts a
+    JOIN sessions s ON a.session_id = s.id
+    JOIN projects p ON a.project_id = p.id
+    WHERE p.name = ? AND s.session_id = ?
+"""
+
 
 @dataclass(frozen=True)
 class ArtifactRecord:
@@ -43,6 +77,7 @@ class ArtifactDatabase:
             db_path = idse_root / DEFAULT_DB_NAME
 
         self.db_path = Path(db_path)
+        self._txn_conn: Optional[sqlite3.Connection] = None
         if not self.db_path.exists() and not allow_create:
             raise FileNotFoundError(
                 f"Database not found at {self.db_path}. Run 'idse init' or 'idse migrate'."
@@ -50,12 +85,37 @@ class ArtifactDatabase:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_schema()
 
-    def _connect(self) -> sqlite3.Connection:
+    def _connect(self) -> Union[sqlite3.Connection, "_SharedConnection"]:
+        if self._txn_conn is not None:
+            return _SharedConnection(self._txn_conn)
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON;")
         return conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run every database call in the block on one connection; commit once.
+
+        Nested blocks join the outer transaction. Any exception rolls back all
+        writes made inside the outermost block.
+        """
+        if self._txn_conn is not None:
+            yield self._txn_conn
+            return
+
+        conn = self._connect()
+        self._txn_conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._txn_conn = None
+            conn.close()
+
     def _init_schema(self) -> None:
         with self._connect() as conn:
             for statement in _schema_statements():
@@ -235,27 +295,7 @@ class ArtifactDatabase:
 
         with self._connect() as conn:
             conn.execute(
-                """
-                INSERT INTO artifacts (
-                    project_id,
-                    session_id,
-                    stage,
-                    idse_id,
-                    content,
-                    content_hash,
-                    semantic_fingerprint,
-                    created_at,
-                    updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(session_id, stage)
-                DO UPDATE SET
-                    idse_id = excluded.idse_id,
-                    content = excluded.content,
-                    content_hash = excluded.content_hash,
-                    semantic_fingerprint = excluded.semantic_fingerprint,
-                    updated_at = excluded.updated_at;
-                """,
+                _UPSERT_ARTIFACT_SQL,
                 (
                     project_id,
                     session_row_id,
@@ -269,40 +309,42 @@ class ArtifactDatabase:
                 ),
             )
             row = conn.execute(
-                """
-                SELECT p.name AS project, s.session_id, a.stage, a.idse_id, a.content, a.content_hash, a.semantic_fingerprint,
-                       a.created_at, a.updated_at
-                FROM artifacts a
-                JOIN sessions s ON a.session_id = s.id
-                JOIN projects p ON a.project_id = p.id
-                WHERE p.name = ? AND s.session_id = ? AND a.stage = ?;
-                """,
+                _SELECT_ARTIFACTS_SQL + " AND a.stage = ?;",
                 (project, session_id, stage),
             ).fetchone()
 
-        return ArtifactRecord(
-            project=row["project"],
-            session_id=row["session_id"],
-            stage=row["stage"],
-            idse_id=row["idse_id"],
-            content=row["content"],
-            content_hash=row["content_hash"],
-            semantic_fingerprint=row["semantic_fingerprint"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
+        return _artifact_record(row)
+
+    def save_artifacts(
+        self, project: str, session_id: str, contents: Dict[str, str]
+    ) -> None:
+        """Upsert several stage artifacts of one session in one executemany."""
+        if not contents:
+            return
+        project_id = self.ensure_project(project)
+        session_row_id = self.ensure_session(project, session_id)
+        now = _now()
+        rows = [
+            (
+                project_id,
+                session_row_id,
+                stage,
+                _make_idse_id(project, session_id, stage),
+                content,
+                _hash_content(content),
+                _semantic_fingerprint(content),
+                now,
+                now,
+            )
+            for stage, content in contents.items()
+        ]
+        with self._connect() as conn:
+            conn.executemany(_UPSERT_ARTIFACT_SQL, rows)
 
     def load_artifact(self, project: str, session_id: str, stage: str) -> ArtifactRecord:
         with self._connect() as conn:
             row = conn.execute(
-                """
-                SELECT p.name AS project, s.session_id, a.stage, a.idse_id, a.content, a.content_hash, a.semantic_fingerprint,
-                       a.created_at, a.updated_at
-                FROM artifacts a
-                JOIN sessions s ON a.session_id = s.id
-                JOIN projects p ON a.project_id = p.id
-                WHERE p.name = ? AND s.session_id = ? AND a.stage = ?;
-                """,
+                _SELECT_ARTIFACTS_SQL + " AND a.stage = ?;",
                 (project, session_id, stage),
             ).fetchone()
 
@@ -311,17 +353,25 @@ class ArtifactDatabase:
                 f"Artifact not found for project={project} session={session_id} stage={stage}"
             )
 
-        return ArtifactRecord(
-            project=row["project"],
-            session_id=row["session_id"],
-            stage=row["stage"],
-            idse_id=row["idse_id"],
-            content=row["content"],
-            content_hash=row["content_hash"],
-            semantic_fingerprint=row["semantic_fingerprint"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
+        return _artifact_record(row)
+
+    def load_artifacts(
+        self, project: str, session_id: str, stages: Iterable[str]
+    ) -> Dict[str, ArtifactRecord]:
+        """Load several stage artifacts for one session with a single query.
+
+        Stages with no stored artifact are absent from the returned dict.
+        """
+        stages = list(stages)
+        if not stages:
+            return {}
+        placeholders = ", ".join("?" for _ in stages)
+        with self._connect() as conn:
+            rows = conn.execute(
+                _SELECT_ARTIFACTS_SQL + f" AND a.stage IN ({placeholders});",
+                (project, session_id, *stages),
+            ).fetchall()
+        return {row["stage"]: _artifact_record(row) for row in rows}
 
     def save_state(self, project: str, state: Dict[str, Any]) -> None:
         project_id = self.ensure_project(project)
@@ -1243,6 +1293,36 @@ class ArtifactDatabase:
         return [dict(row) for row in rows]
 
 
+class _SharedConnection:
+    """Context-manager view of a transaction connection.
+
+    Leaving the block neither commits nor closes the connection.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+def _artifact_record(row: sqlite3.Row) -> ArtifactRecord:
+    return ArtifactRecord(
+        project=row["project"],
+        session_id=row["session_id"],
+        stage=row["stage"],
+        idse_id=row["idse_id"],
+        content=row["content"],
+        content_hash=row["content_hash"],
+        semantic_fingerprint=row["semantic_fingerprint"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
 def _now() -> str:
     return datetime.now().isoformat()
 
@@ -13,6 +13,7 @@ import click
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
+import logging
 import sys
 import re
 from urllib.parse import parse_qs, urlparse
@@ -20,6 +21,30 @@ from urllib.parse import parse_qs, urlparse
 from . import __version__
 
 
+class _EchoHandler(logging.Handler):
+    """Route package log records to the console through click.echo."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        level_prefix = "Warning: " if record.levelno >= logging.WARNING else ""
+        click.echo(
+            level_prefix + self.format(record),
+            err=record.levelno >= logging.WARNING,
+        )
+
+
+def _configure_logging() -> None:
+    """Echo package log records at INFO and above to the console.
+
+    Library modules log instead of printing and install no handler of their
+    own, so outside the CLI an unconfigured logger still reports warnings on
+    stderr through logging.lastResort.
+    """
+    package_logger = logging.getLogger("idse_orchestrator")
+    if not any(isinstance(h, _EchoHandler) for h in package_logger.handlers):
+        package_logger.addHandler(_EchoHandler())
+        package_logger.setLevel(logging.INFO)
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="idse")
 @click.option(
@@ -35,6 +60,7 @@ def main(ctx, backend: Optional[str]):
     Manage Intent-Driven Systems Engineering projects in your workspace.
     This CLI coordinates IDE agents and manages pipeline artifacts locally.
     """
+    _configure_logging()
     # Ensure context object exists
     ctx.ensure_object(dict)
     if backend:
@@ -1820,39 +1846,19 @@ def create_session(ctx, session_name: str, project: str):
         click.echo(f"❌ Error: Session '{session_id}' already exists", err=True)
         sys.exit(1)
 
-    dirs_to_create = [
-        session_path / "intents",
-        session_path / "contexts",
-        session_path / "specs",
-        session_path / "plans",
-        session_path / "tasks",
-        session_path / "implementation",
-        session_path / "feedback",
-        session_path / "metadata"
-    ]
+    from .fs_utils import artifact_writes, make_session_dirs, write_files
 
-    for dir_path in dirs_to_create:
-        dir_path.mkdir(parents=True, exist_ok=True)
+    make_session_dirs(session_path)
 
     loader = PipelineArtifacts()
     artifacts = loader.load_all_templates(project_name=project, stack="python")
 
-    artifact_map = {
-        "intent.md": session_path / "intents" / "intent.md",
-        "context.md": session_path / "contexts" / "context.md",
-        "spec.md": session_path / "specs" / "spec.md",
-        "plan.md": session_path / "plans" / "plan.md",
-        "tasks.md": session_path / "tasks" / "tasks.md",
-        "feedback.md": session_path / "feedback" / "feedback.md",
-        "implementation_readme.md": session_path / "implementation" / "README.md"
-    }
-
-    for template_name, file_path in artifact_map.items():
-        if template_name in artifacts:
-            file_path.write_text(artifacts[template_name])
-
-    owner_file = session_path / "metadata" / ".owner"
-    owner_file.write_text(f"Created: {datetime.now().isoformat()}\n")
+    now_iso = datetime.now().isoformat()
+    writes = artifact_writes(session_path, artifacts)
+    writes.append(
+        (str(session_path / "metadata" / ".owner"), f"Created: {now_iso}\n")
+    )
+    write_files(writes)
 
     from .session_metadata import SessionMetadata
 
@@ -1868,8 +1874,8 @@ def create_session(ctx, session_name: str, project: str):
         collaborators=[],
         tags=[],
         status="draft",
-        created_at=datetime.now().isoformat(),
-        updated_at=datetime.now().isoformat(),
+        created_at=now_iso,
+        updated_at=now_iso,
     )
     metadata.save(session_path)
 
@@ -2163,9 +2169,10 @@ def set_status(ctx, session_id: str, session_status: str, project: Optional[str]
                 for error in validation_results["errors"]:
                     click.echo(f"   ✗ {error}", err=True)
                 sys.exit(1)
-            for stage in tracker.STAGE_NAMES:
-                tracker.update_stage(stage, "completed")
-            tracker.set_validation_status("passing")
+            with tracker.batch():
+                for stage in tracker.STAGE_NAMES:
+                    tracker.update_stage(stage, "completed")
+                tracker.set_validation_status("passing")
 
         click.echo(f"✅ Status updated for {project_name}/{session_id}: {normalized_status}")
     except Exception as e:
@@ -2304,17 +2311,16 @@ def spawn(ctx, plan: str, feature_name: str, project: Optional[str], blueprint:
         # Create feature session using SessionGraph
         from .session_graph import SessionGraph
 
-        session_path = SessionGraph(project_path).create_feature_session(
+        graph = SessionGraph(project_path)
+        session_path = graph.create_feature_session(
             session_id=feature_name,
             parent_session=blueprint,
             description=description,
             owner=owner
         )
 
-        # Update blueprint meta.md
-        from .session_graph import SessionGraph
-
-        SessionGraph(project_path).update_blueprint_meta(project_path, session_path)
+        # Update blueprint meta.md (reuses the metadata just written)
+        graph.update_blueprint_meta(project_path, session_path)
 
         click.echo("")
         click.echo(f"✅ Feature session '{feature_name}' spawned successfully!")
@@ -2447,7 +2453,7 @@ def sessions(ctx, project: Optional[str], session_type: Optional[str], session_s
             click.echo(f"❌ Error: Project '{project}' not found", err=True)
             sys.exit(1)
 
-        session_mgr = SessionManager(project_path)
+        session_mgr = SessionManager.get(project_path)
         sessions_list = session_mgr.list_sessions(
             session_type=session_type,
             status=session_status,
@@ -2546,7 +2552,7 @@ def session_info(ctx, session_id: str, project: Optional[str], lineage: bool):
             click.echo(f"❌ Error: Project '{project}' not found", err=True)
             sys.exit(1)
 
-        session_mgr = SessionManager(project_path)
+        session_mgr = SessionManager.get(project_path)
 
         if lineage:
             info = session_mgr.get_session_lineage(session_id)
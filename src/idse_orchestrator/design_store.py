@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, Dict, List
 
+from .fs_utils import IO_POOL
+
 
 class DesignStore(ABC):
     @abstractmethod
@@ -86,25 +88,51 @@ class DesignStoreFilesystem(DesignStore):
 
     def push_artifacts(self, project: str, session_id: str, artifacts: Dict[str, str]) -> List[str]:
         """Persist artifacts by stage. Returns list of stages written."""
-        pushed = []
-        for stage, content in artifacts.items():
-            if stage in self.STAGE_PATHS:
-                self.save_artifact(project, session_id, stage, content)
-                pushed.append(stage)
+        pushed = [stage for stage in artifacts if stage in self.STAGE_PATHS]
+        if len(pushed) <= 1:
+            for stage in pushed:
+                self.save_artifact(
+                    project, session_id, stage, artifacts[stage]
+                )
+            return pushed
+
+        futures = [
+            IO_POOL.submit(
+                self.save_artifact,
+                project,
+                session_id,
+                stage,
+                artifacts[stage],
+            )
+            for stage in pushed
+        ]
+        for future in futures:
+            future.result()
         return pushed
 
     def pull_artifacts(self, project: str, session_id: str, stages: Optional[List[str]] = None) -> Dict[str, str]:
         """Load artifacts by stage. Missing files are skipped."""
-        stages_to_pull = stages or list(self.STAGE_PATHS.keys())
-        artifacts: Dict[str, str] = {}
-        for stage in stages_to_pull:
-            if stage not in self.STAGE_PATHS:
-                continue
+        stages_to_pull = [
+            stage
+            for stage in stages or self.STAGE_PATHS
+            if stage in self.STAGE_PATHS
+        ]
+
+        def load(stage: str) -> Optional[str]:
             try:
-                artifacts[stage] = self.load_artifact(project, session_id, stage)
+                return self.load_artifact(project, session_id, stage)
             except FileNotFoundError:
-                continue
-        return artifacts
+                return None
+
+        if len(stages_to_pull) <= 1:
+            contents = map(load, stages_to_pull)
+        else:
+            contents = IO_POOL.map(load, stages_to_pull)
+        return {
+            stage: content
+            for stage, content in zip(stages_to_pull, contents)
+            if content is not None
+        }
 
 
 def _read_json(path: Path) -> Dict:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
 from typing import List, Tuple
 
+from .fs_utils import copy_small
+
 DOC_FILES = [
     "01-idse-philosophy.md",
     "02-idse-constitution.md",
@@ -83,6 +84,6 @@ def _copy_files(source_dir: Path, dest_dir: Path, filenames: List[str], force: b
         if dest.exists() and not force:
             continue
 
-        shutil.copy2(src, dest)
+        copy_small(src, dest)
         copied += 1
     return copied
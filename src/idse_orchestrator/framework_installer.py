@@ -3,8 +3,28 @@
 from pathlib import Path
 import shutil
 import json
+import logging
 from typing import Optional
 
+log = logging.getLogger(__name__)
+
+# Closing banner of install_agency_swarm, logged as a single record.
+_AGENCY_SWARM_SUMMARY = """
+✅ Agency Swarm framework resources installed
+
+📘 Constitution: .idse/governance/AGENCY_SWARM_CONSTITUTION.md
+🔧 Workflow: .cursor/rules/workflow.mdc
+🤖 Sub-agents: .claude/agents/ (6 specialized orchestration agents)
+⚡ Commands: .cursor/commands/ (5 helper utilities)
+📋 Metadata: metadata/framework.json
+
+Next steps:
+  1. Install Agency Swarm: pip install agency-swarm
+  2. Follow .cursor/rules/workflow.mdc for agent creation
+  3. Use .claude/agents/ for orchestrated agency building
+  4. Use IDSE pipeline (blueprint) for project-level planning
+"""
+
 
 def find_git_root(start_path: Path) -> Optional[Path]:
     """
@@ -48,7 +68,7 @@ def install_agentic_framework(project_path: Path, framework: str, stack: str) ->
 def install_agency_swarm(project_path: Path, stack: str) -> None:
     """Install Agency Swarm framework resources."""
 
-    print("\n🤖 Installing Agency Swarm framework resources...")
+    log.info("\n🤖 Installing Agency Swarm framework resources...")
 
     # Resolve packaged governance files
     pkg_governance = Path(__file__).parent / "governance"
@@ -61,9 +81,9 @@ def install_agency_swarm(project_path: Path, stack: str) -> None:
 
     if constitution_src.exists():
         shutil.copy(constitution_src, constitution_dst)
-        print("  ✓ Copied AGENCY_SWARM_CONSTITUTION.md")
+        log.info("  ✓ Copied AGENCY_SWARM_CONSTITUTION.md")
     else:
-        print(f"  ⚠ Warning: Source constitution not found at {constitution_src}")
+        log.warning("Source constitution not found at %s", constitution_src)
 
     # Workflow file packaged with resources (submodule or copied fallback)
     workflow_src = (
@@ -90,10 +110,14 @@ def install_agency_swarm(project_path: Path, stack: str) -> None:
 
     if workflow_src.exists():
         shutil.copy(workflow_src, workflow_dst)
-        print(f"  ✓ Copied .cursor/rules/workflow.mdc to {workflow_dst}")
+        log.info("  ✓ Copied .cursor/rules/workflow.mdc to %s", workflow_dst)
     else:
-        print(f"  ⚠ Warning: Workflow not found at {workflow_src}")
-        print("     Run: git submodule update --init --recursive to fetch template")
+        log.warning(
+            "Workflow not found at %s\n"
+            "     Run: git submodule update --init --recursive"
+            " to fetch template",
+            workflow_src,
+        )
 
     # Source directory: agency-starter-template submodule
     submodule_root = (
@@ -111,9 +135,14 @@ def install_agency_swarm(project_path: Path, stack: str) -> None:
         claude_agents_dst.parent.mkdir(parents=True, exist_ok=True)
         shutil.copytree(claude_agents_src, claude_agents_dst, dirs_exist_ok=True)
         agent_count = len(list(claude_agents_src.glob("*.md")))
-        print(f"  ✓ Copied {agent_count} sub-agent definitions to .claude/agents/")
+        log.info(
+            "  ✓ Copied %d sub-agent definitions to .claude/agents/",
+            agent_count,
+        )
     else:
-        print(f"  ⚠ Warning: .claude/agents/ not found in submodule at {claude_agents_src}")
+        log.warning(
+            ".claude/agents/ not found in submodule at %s", claude_agents_src
+        )
 
     # Copy .claude/README.md
     claude_readme_src = submodule_root / ".claude" / "README.md"
@@ -122,7 +151,7 @@ def install_agency_swarm(project_path: Path, stack: str) -> None:
     if claude_readme_src.exists():
         claude_readme_dst.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy(claude_readme_src, claude_readme_dst)
-        print(f"  ✓ Copied .claude/README.md")
+        log.info("  ✓ Copied .claude/README.md")
 
     # Copy .cursor/commands/ directory (helper commands)
     cursor_commands_src = submodule_root / ".cursor" / "commands"
@@ -132,7 +161,9 @@ def install_agency_swarm(project_path: Path, stack: str) -> None:
         cursor_commands_dst.parent.mkdir(parents=True, exist_ok=True)
         shutil.copytree(cursor_commands_src, cursor_commands_dst, dirs_exist_ok=True)
         command_count = len(list(cursor_commands_src.glob("*.md")))
-        print(f"  ✓ Copied {command_count} helper commands to .cursor/commands/")
+        log.info(
+            "  ✓ Copied %d helper commands to .cursor/commands/", command_count
+        )
 
     # Framework metadata within project
     metadata = {
@@ -148,19 +179,6 @@ def install_agency_swarm(project_path: Path, stack: str) -> None:
     metadata_dir.mkdir(parents=True, exist_ok=True)
     framework_file = metadata_dir / "framework.json"
     framework_file.write_text(json.dumps(metadata, indent=2))
-    print("  ✓ Created metadata/framework.json")
-
-    print("\n✅ Agency Swarm framework resources installed")
-    print("")
-    print("📘 Constitution: .idse/governance/AGENCY_SWARM_CONSTITUTION.md")
-    print("🔧 Workflow: .cursor/rules/workflow.mdc")
-    print("🤖 Sub-agents: .claude/agents/ (6 specialized orchestration agents)")
-    print("⚡ Commands: .cursor/commands/ (5 helper utilities)")
-    print("📋 Metadata: metadata/framework.json")
-    print("")
-    print("Next steps:")
-    print("  1. Install Agency Swarm: pip install agency-swarm")
-    print("  2. Follow .cursor/rules/workflow.mdc for agent creation")
-    print("  3. Use .claude/agents/ for orchestrated agency building")
-    print("  4. Use IDSE pipeline (blueprint) for project-level planning")
-    print("")
+    log.info("  ✓ Created metadata/framework.json")
+
+    log.info(_AGENCY_SWARM_SUMMARY)
@@ -0,0 +1,146 @@
+"""
+Filesystem Utilities
+
+Shared I/O thread pool and small-file helpers used by the session,
+workspace, design store, and validation modules.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+import contextlib
+import os
+import shutil
+import threading
+
+# Shared pool for independent small-file reads and writes; latency-bound on
+# network filesystems, so a handful of threads overlap the round trips.
+IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="idse-io")
+
+# Leaf directories of every session scaffold.
+SESSION_SUBDIRS = (
+    "intents",
+    "contexts",
+    "specs",
+    "plans",
+    "tasks",
+    "implementation",
+    "feedback",
+    "metadata",
+)
+
+# Pipeline artifact name -> file path relative to the session directory.
+SESSION_ARTIFACT_FILES = (
+    ("intent.md", os.path.join("intents", "intent.md")),
+    ("context.md", os.path.join("contexts", "context.md")),
+    ("spec.md", os.path.join("specs", "spec.md")),
+    ("plan.md", os.path.join("plans", "plan.md")),
+    ("tasks.md", os.path.join("tasks", "tasks.md")),
+    ("feedback.md", os.path.join("feedback", "feedback.md")),
+    (
+        "implementation_readme.md",
+        os.path.join("implementation", "README.md"),
+    ),
+)
+
+
+def artifact_writes(
+    session_path: Union[str, Path], artifacts: Dict[str, str]
+) -> List[Tuple[str, Union[str, bytes]]]:
+    """Pair each rendered pipeline artifact with its path under a session."""
+    sp = str(session_path)
+    return [
+        (os.path.join(sp, relative), artifacts[name])
+        for name, relative in SESSION_ARTIFACT_FILES
+        if name in artifacts
+    ]
+
+
+def make_session_dirs(session_path: Union[str, Path]) -> None:
+    """Create a session directory once, then each leaf with a single mkdir."""
+    os.makedirs(session_path, exist_ok=True)
+    for subdir in SESSION_SUBDIRS:
+        try:
+            os.mkdir(os.path.join(session_path, subdir))
+        except FileExistsError:
+            pass
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` to ``path`` unless the file already holds it."""
+    try:
+        if path.read_text() == content:
+            return False
+    except OSError:
+        pass
+    path.write_text(content)
+    return True
+
+
+def write_small(path: Union[str, Path], content: Union[str, bytes]) -> None:
+    """Write a small file with a single open/write/close and no buffering."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write ``data`` to a sibling temp file and rename it over ``path``.
+
+    Readers never see a partial file. The temp name carries the process
+    and thread ids, so concurrent writers of the same file never share
+    one. Raises FileNotFoundError if the parent directory is missing.
+    """
+    tmp = path.with_name(
+        f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def write_files(
+    writes: List[Tuple[Union[str, Path], Union[str, bytes]]]
+) -> None:
+    """Write independent (path, content) pairs concurrently on IO_POOL."""
+    # Consume the iterator so any write error propagates to the caller.
+    list(IO_POOL.map(lambda job: write_small(*job), writes))
+
+
+def read_files(paths: List[Union[str, Path]]) -> List[str]:
+    """Read small UTF-8 files concurrently on IO_POOL, preserving order."""
+    return list(
+        IO_POOL.map(
+            lambda path: Path(path).read_bytes().decode("utf-8"), paths
+        )
+    )
+
+
+def copy_small(src: Path, dst: Path) -> None:
+    """Copy a small file's bytes without the metadata syscalls of copy2."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(
+                    fdst.fileno(), fsrc.fileno(), offset, size - offset
+                )
+                if sent == 0:
+                    break
+                offset += sent
+    except (AttributeError, OSError):
+        # No os.sendfile on this platform (or unsupported for these files).
+        shutil.copyfile(src, dst)
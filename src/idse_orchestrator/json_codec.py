@@ -0,0 +1,40 @@
+"""
+JSON Codec
+
+Encode/decode helpers for on-disk JSON metadata. Uses orjson when it is
+installed and falls back to the standard library json module otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, memoryview, str]) -> Any:
+    """Decode JSON from bytes, a bytes-like memoryview, or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Encode ``obj`` as compact single-line UTF-8 JSON (for JSON Lines)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
@@ -8,9 +8,73 @@ Loads IDSE pipeline templates and performs substitutions while preserving
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Dict, Optional, Tuple
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 from datetime import datetime
+import os
+import re
+
+# Artifact name -> template file, in the order artifacts are produced.
+PIPELINE_TEMPLATE_FILES = (
+    ("intent.md", "intent-template.md"),
+    ("context.md", "context-template.md"),
+    ("spec.md", "spec-template.md"),
+    ("plan.md", "plan-template.md"),
+    ("tasks.md", "tasks-template.md"),
+    ("feedback.md", "feedback-template.md"),
+    ("implementation_readme.md", "implementation-scaffold.md"),
+)
+
+
+# Placeholders replaced by PipelineArtifacts._substitute in a single pass.
+_SUBSTITUTION_RE = re.compile(r"\{\{(project_name|stack|timestamp|date)\}\}")
+
+# Template path -> ((st_mtime_ns, st_size), raw text). Entries are reused until
+# the file's stat changes, so edited templates are picked up without a restart.
+_TEMPLATE_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def _read_template(path: str) -> Optional[str]:
+    """Return the raw text of a template file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    content = Path(path).read_text()
+    _TEMPLATE_CACHE[path] = (key, content)
+    return content
+
+
+def _has_markdown_files(path: Path) -> bool:
+    """Return True if ``path`` is a directory holding at least one .md file."""
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return False
+    with entries:
+        return any(entry.name.endswith(".md") for entry in entries)
+
+
+def _read_pipeline_templates(
+    templates_dir: Optional[str],
+) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Return (artifact name, raw template text or None) pairs."""
+    if templates_dir is None:
+        return tuple(
+            (artifact_name, None)
+            for artifact_name, _ in PIPELINE_TEMPLATE_FILES
+        )
+    return tuple(
+        (
+            artifact_name,
+            _read_template(os.path.join(templates_dir, template_file)),
+        )
+        for artifact_name, template_file in PIPELINE_TEMPLATE_FILES
+    )
 
 
 class PipelineArtifacts:
@@ -35,7 +99,7 @@ class PipelineArtifacts:
             ]
 
             for path in possible_paths:
-                if path.exists() and list(path.glob("*.md")):
+                if _has_markdown_files(path):
                     templates_dir = path
                     break
             else:
@@ -43,18 +107,25 @@ class PipelineArtifacts:
                 templates_dir = None
 
         self.templates_dir = templates_dir
+        self._env: Optional[Environment] = None
+        self._compiled: Dict[str, Template] = {}
 
-        # Initialize Jinja2 environment only if templates exist
-        if self.templates_dir:
-            self.env = Environment(
-                loader=FileSystemLoader(str(templates_dir)),
+    @property
+    def env(self) -> Optional[Environment]:
+        """Jinja2 environment for the templates directory, built on first use.
+
+        Session creation only needs load_all_templates, which does plain
+        substitution, so most instances never pay for the environment.
+        """
+        if self._env is None and self.templates_dir:
+            self._env = Environment(
+                loader=FileSystemLoader(str(self.templates_dir)),
                 autoescape=select_autoescape(),
                 keep_trailing_newline=True,
             )
             # Preserve [REQUIRES INPUT] markers
-            self.env.filters["preserve_markers"] = lambda x: x
-        else:
-            self.env = None
+            self._env.filters["preserve_markers"] = lambda x: x
+        return self._env
 
     def load_template(self, template_name: str, **context) -> str:
         """
@@ -67,7 +138,10 @@ class PipelineArtifacts:
         Returns:
             Rendered template content
         """
-        template = self.env.get_template(template_name)
+        template = self._compiled.get(template_name)
+        if template is None:
+            template = self.env.get_template(template_name)
+            self._compiled[template_name] = template
         return template.render(**context)
 
     def load_all_templates(self, project_name: str, stack: str = "python") -> Dict[str, str]:
@@ -81,30 +155,20 @@ class PipelineArtifacts:
         Returns:
             Dictionary mapping template names to rendered content
         """
+        now = datetime.now()
         context = {
             "project_name": project_name,
             "stack": stack,
-            "timestamp": datetime.now().isoformat(),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-        }
-
-        templates = {
-            "intent.md": "intent-template.md",
-            "context.md": "context-template.md",
-            "spec.md": "spec-template.md",
-            "plan.md": "plan-template.md",
-            "tasks.md": "tasks-template.md",
-            "feedback.md": "feedback-template.md",
-            "implementation_readme.md": "implementation-scaffold.md",
+            "timestamp": now.isoformat(),
+            "date": now.strftime("%Y-%m-%d"),
         }
 
         artifacts = {}
 
-        for artifact_name, template_file in templates.items():
-            template_path = self.templates_dir / template_file
-
-            if template_path.exists():
-                artifacts[artifact_name] = self._load_raw_template(template_path, context)
+        templates_dir = str(self.templates_dir) if self.templates_dir else None
+        for artifact_name, content in _read_pipeline_templates(templates_dir):
+            if content is not None:
+                artifacts[artifact_name] = self._substitute(content, context)
             else:
                 artifacts[artifact_name] = self._create_placeholder(artifact_name, context)
 
@@ -134,15 +198,26 @@ class PipelineArtifacts:
         Returns:
             Template content with basic substitutions
         """
-        content = template_path.read_text()
+        content = _read_template(str(template_path))
+        if content is None:
+            raise FileNotFoundError(f"Template not found: {template_path}")
+        return self._substitute(content, context)
 
-        # Simple string substitution for now (can use Jinja2 later)
-        content = content.replace("{{project_name}}", context["project_name"])
-        content = content.replace("{{stack}}", context["stack"])
-        content = content.replace("{{timestamp}}", context["timestamp"])
-        content = content.replace("{{date}}", context["date"])
+    def _substitute(self, content: str, context: Dict) -> str:
+        """
+        Apply the minimal placeholder substitutions to raw template text.
 
-        return content
+        Args:
+            content: Raw template content
+            context: Substitution context
+
+        Returns:
+            Template content with basic substitutions
+        """
+        # Simple string substitution for now (can use Jinja2 later)
+        return _SUBSTITUTION_RE.sub(
+            lambda match: context[match.group(1)], content
+        )
 
     def _create_placeholder(self, artifact_name: str, context: Dict) -> str:
         """
@@ -8,14 +8,47 @@ from __future__ import annotations
 
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-import json
+from typing import Dict, Optional, Set
+import functools
+import logging
+import os
 import shutil
 
+from . import __version__, json_codec
+from .artifact_database import ArtifactDatabase
+from .design_store import DesignStoreFilesystem
+from .docs_installer import install_docs
+from .file_view_generator import FileViewGenerator
+from .fs_utils import (
+    artifact_writes,
+    copy_small,
+    make_session_dirs,
+    read_files,
+    write_files,
+)
+from .pipeline_artifacts import PipelineArtifacts
+from .session_graph import SessionGraph
+from .session_metadata import SessionMetadata
+from .stage_state_model import StageStateModel
+
+log = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template(path: str) -> Optional[str]:
+    """Return a packaged template's text, or None if the file is missing."""
+    try:
+        return Path(path).read_text()
+    except FileNotFoundError:
+        return None
+
 
 class ProjectWorkspace:
     """Manages IDSE project lifecycle operations."""
 
+    # Workspace roots whose reference docs were installed by this process.
+    _DOCS_INSTALLED: Set[Path] = set()
+
     def __init__(self, workspace_root: Optional[Path] = None):
         """
         Initialize ProjectWorkspace.
@@ -26,6 +59,12 @@ class ProjectWorkspace:
         self.workspace_root = workspace_root or Path.cwd()
         self.idse_root = self.workspace_root / ".idse"
         self.projects_root = self.idse_root / "projects"
+        # idse_root whose governance files were last ensured; compared against
+        # the current root so get_current_project() relocations invalidate it.
+        self._governance_root: Optional[Path] = None
+        # cwd -> workspace root (directory holding .idse) found by
+        # get_current_project()
+        self._workspace_roots: Dict[Path, Path] = {}
 
     def init_project(
         self,
@@ -58,61 +97,41 @@ class ProjectWorkspace:
         if project_path.exists():
             raise ValueError(f"Project '{project_name}' already exists at {project_path}")
 
-        # Ensure governance/docs are present in workspace-level .idse
-        self._ensure_governance_files()
-        self._install_reference_docs()
-        self._cleanup_nested_idse(project_path)
+        now_iso = datetime.now().isoformat()
+
+        # Ensure governance/docs are present in workspace-level .idse. The
+        # marker is versioned so an upgraded orchestrator installs its new
+        # files once.
+        installed_marker = (
+            self.idse_root / f".governance_installed-{__version__}"
+        )
+        if not installed_marker.exists():
+            self._ensure_governance_files()
+            if self._install_reference_docs():
+                installed_marker.touch()
+        # project_path was just verified absent, so there is no nested .idse to
+        # clean up here; cleanup_nested_idse is reserved for existing projects.
 
         # Create project structure
         session_id = "__blueprint__"
         session_path = project_path / "sessions" / session_id
 
-        # Create all directories
-        dirs_to_create = [
-            session_path / "intents",
-            session_path / "contexts",
-            session_path / "specs",
-            session_path / "plans",
-            session_path / "tasks",
-            session_path / "implementation",
-            session_path / "feedback",
-            session_path / "metadata",
-        ]
-
-        for dir_path in dirs_to_create:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        # Plain string joins: these paths are only handed to os-level calls.
+        sp = str(session_path)
 
-        # Load and populate templates
-        from .pipeline_artifacts import PipelineArtifacts
+        # Create the session directory once, then only its leaf children
+        make_session_dirs(sp)
 
+        # Load and populate templates
         loader = PipelineArtifacts()
         artifacts = loader.load_all_templates(project_name=project_name, stack=stack)
 
-        # Write artifacts
-        artifact_map = {
-            "intent.md": session_path / "intents" / "intent.md",
-            "context.md": session_path / "contexts" / "context.md",
-            "spec.md": session_path / "specs" / "spec.md",
-            "plan.md": session_path / "plans" / "plan.md",
-            "tasks.md": session_path / "tasks" / "tasks.md",
-            "feedback.md": session_path / "feedback" / "feedback.md",
-            "implementation_readme.md": session_path / "implementation" / "README.md",
-        }
-
-        for template_name, file_path in artifact_map.items():
-            if template_name in artifacts:
-                file_path.write_text(artifacts[template_name])
-
         # Create .owner metadata file (for backward compatibility)
-        owner_file = session_path / "metadata" / ".owner"
-        owner_file.write_text(f"Created: {datetime.now().isoformat()}\n")
+        owner_text = f"Created: {now_iso}\n"
         if owner:
-            with owner_file.open("a") as f:
-                f.write(f"Owner: {owner}\n")
+            owner_text += f"Owner: {owner}\n"
 
         # Create session.json metadata
-        from .session_metadata import SessionMetadata
-
         metadata = SessionMetadata(
             session_id=session_id,
             name=project_name if is_blueprint else session_id,
@@ -125,66 +144,84 @@ class ProjectWorkspace:
             collaborators=[],
             tags=[],
             status="draft",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
-        metadata.save(session_path)
 
-        # Create CURRENT_SESSION pointer
-        from .session_graph import SessionGraph
+        # Write artifacts, .owner, and session.json in one batch
+        writes = artifact_writes(sp, artifacts)
+        writes.append((os.path.join(sp, "metadata", ".owner"), owner_text))
+        writes.append(
+            (
+                os.path.join(sp, "metadata", "session.json"),
+                metadata.dump_bytes(),
+            )
+        )
+        write_files(writes)
 
-        SessionGraph(project_path).set_current_session(session_id)
+        # Create CURRENT_SESSION pointer
+        graph = SessionGraph(project_path)
+        graph.set_current_session(session_id)
 
         # Initialize session_state.json
-        from .stage_state_model import StageStateModel
-
         tracker = StageStateModel(project_path, session_id=session_id)
         tracker.init_state(project_name, session_id, is_blueprint=is_blueprint)
 
         # Create blueprint meta.md if this is a blueprint session
         if is_blueprint:
-            SessionGraph(project_path).create_blueprint_meta(project_path, project_name)
+            graph.create_blueprint_meta(project_path, project_name)
 
         # Create agent instruction files if requested
         if create_agent_files:
-            self._create_agent_instructions(project_name, stack)
+            self._create_agent_instructions(
+                project_name, stack, timestamp=now_iso
+            )
 
         if backend is None or backend == "sqlite":
-            from .artifact_database import ArtifactDatabase
-            from .design_store import DesignStoreFilesystem
-            from .file_view_generator import FileViewGenerator
-
             db = ArtifactDatabase(idse_root=self.idse_root)
-            db.ensure_project(project_name, stack=stack, owner=owner)
-            db.ensure_session(
-                project_name,
-                session_id,
-                name=metadata.name,
-                session_type=metadata.session_type,
-                description=metadata.description,
-                is_blueprint=metadata.is_blueprint,
-                parent_session=metadata.parent_session,
-                owner=metadata.owner,
-                status=metadata.status,
-            )
-            db.save_session_extras(
-                project_name,
-                session_id,
-                collaborators=[c.to_dict() for c in metadata.collaborators],
-                tags=metadata.tags,
-            )
-
-            stage_paths = {
-                stage: session_path / folder / filename
+            stage_paths = [
+                (stage, session_path / folder / filename)
                 for stage, (folder, filename) in DesignStoreFilesystem.STAGE_PATHS.items()
-            }
-            for stage, path in stage_paths.items():
-                if path.exists():
-                    db.save_artifact(project_name, session_id, stage, path.read_text())
+            ]
+            stage_paths = [
+                (stage, path) for stage, path in stage_paths if path.exists()
+            ]
+            # Read every stage file up front, concurrently, so the DB work
+            # below is pure inserts.
+            stage_contents = dict(
+                zip(
+                    (stage for stage, _ in stage_paths),
+                    read_files([path for _, path in stage_paths]),
+                )
+            )
 
-            tracker = StageStateModel(project_path, session_id=session_id)
-            db.save_session_state(project_name, session_id, tracker.get_status(project_name))
-            db.set_current_session(project_name, session_id)
+            # Seed everything in one transaction: one connection, one commit.
+            with db.transaction():
+                db.ensure_project(project_name, stack=stack, owner=owner)
+                db.ensure_session(
+                    project_name,
+                    session_id,
+                    name=metadata.name,
+                    session_type=metadata.session_type,
+                    description=metadata.description,
+                    is_blueprint=metadata.is_blueprint,
+                    parent_session=metadata.parent_session,
+                    owner=metadata.owner,
+                    status=metadata.status,
+                )
+                db.save_session_extras(
+                    project_name,
+                    session_id,
+                    collaborators=[
+                        c.to_dict() for c in metadata.collaborators
+                    ],
+                    tags=metadata.tags,
+                )
+                db.save_artifacts(project_name, session_id, stage_contents)
+                db.save_session_state(
+                    project_name, session_id, tracker.get_status(project_name)
+                )
+                db.set_current_session(project_name, session_id)
 
             generator = FileViewGenerator(idse_root=self.idse_root, allow_create=True)
             generator.generate_session(project_name, session_id)
@@ -193,9 +230,7 @@ class ProjectWorkspace:
             try:
                 registry_path = self._project_path(project_name) / "agent_registry.json"
                 if registry_path.exists():
-                    import json
-
-                    registry = json.loads(registry_path.read_text())
+                    registry = json_codec.loads(registry_path.read_bytes())
                     db.save_agent_registry(project_name, registry)
                     generator.generate_agent_registry(project_name)
             except Exception:
@@ -203,16 +238,23 @@ class ProjectWorkspace:
 
         return project_path
 
-    def _cleanup_nested_idse(self, project_path: Path) -> None:
+    def cleanup_nested_idse(self, project_path: Path) -> bool:
         """
         Guardrail: ensure no nested .idse folder lives inside a project.
 
         Governance/docs belong at workspace .idse/, not under projects/<name>/.idse.
-        If found, remove it to avoid duplicate governance copies.
+        If found, remove it to avoid duplicate governance copies. Only
+        meaningful for projects that already exist on disk (e.g. migration
+        tooling); init_project skips it.
+
+        Returns:
+            True if a nested .idse directory was removed
         """
-        nested = project_path / ".idse"
-        if nested.exists():
-            shutil.rmtree(nested, ignore_errors=True)
+        nested = os.path.join(project_path, ".idse")
+        if not os.path.isdir(nested):
+            return False
+        shutil.rmtree(nested, ignore_errors=True)
+        return True
 
     def get_current_project(self) -> Optional[Path]:
         """
@@ -221,52 +263,74 @@ class ProjectWorkspace:
         Returns:
             Path to current project, or None if not in an IDSE project
         """
-        # Look for .idse directory in current path hierarchy
-        current = Path.cwd()
-
-        while current != current.parent:
-            idse_path = current / ".idse"
-            if idse_path.exists():
-                # Update workspace_root to match where .idse was found
-                self.workspace_root = current
-                self.idse_root = idse_path
-                self.projects_root = idse_path / "projects"
-
-                # Find which project we're in by checking subdirectories
-                projects = [p for p in self.projects_root.iterdir() if p.is_dir()]
-                if not projects:
-                    return None
-
-                if len(projects) == 1:
-                    return projects[0]
-
-                current_marker = self.projects_root / "CURRENT_PROJECT"
-                if current_marker.exists():
-                    name = current_marker.read_text().strip()
-                    candidate = self.projects_root / name
-                    if candidate.exists():
-                        return candidate
-
-                return projects[0]
-            current = current.parent
+        root = self._find_workspace_root(Path.cwd())
+        if root is None:
+            return None
+
+        # Update workspace_root to match where .idse was found
+        idse_path = root / ".idse"
+        self.workspace_root = root
+        self.idse_root = idse_path
+        self.projects_root = idse_path / "projects"
+
+        # Find which project we're in by checking subdirectories; stop at the
+        # second one since only "one vs. several" matters below.
+        first_project: Optional[Path] = None
+        with os.scandir(self.projects_root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if first_project is not None:
+                    break
+                first_project = Path(entry.path)
+            else:
+                return first_project
+
+        try:
+            name = (self.projects_root / "CURRENT_PROJECT").read_text().strip()
+        except FileNotFoundError:
+            return first_project
+        candidate = self.projects_root / name
+        if name and os.path.isdir(candidate):
+            return candidate
+
+        return first_project
+
+    def _find_workspace_root(self, cwd: Path) -> Optional[Path]:
+        """Return the nearest ancestor of ``cwd`` holding .idse (memoized)."""
+        cached = self._workspace_roots.get(cwd)
+        if cached is not None and (cached / ".idse").exists():
+            return cached
+
+        # Look for .idse directory in current path hierarchy, walking plain
+        # strings so no Path is built per ancestor.
+        current = str(cwd)
+        parent = os.path.dirname(current)
+        while current != parent:
+            if os.path.isdir(os.path.join(current, ".idse")):
+                root = Path(current)
+                self._workspace_roots[cwd] = root
+                return root
+            current, parent = parent, os.path.dirname(parent)
 
         return None
 
-    def _create_agent_instructions(self, project_name: str, stack: str) -> None:
+    def _create_agent_instructions(
+        self, project_name: str, stack: str, timestamp: Optional[str] = None
+    ) -> None:
         """
         Create agent instruction files in the workspace root.
 
         Args:
             project_name: Name of the project
             stack: Technology stack
+            timestamp: ISO timestamp to stamp into the files. Defaults to now.
 
         Creates:
             - CLAUDE.md: Instructions for Claude Code
             - AGENTS.md: Generic instructions for all AI agents
             - .cursorrules: Rules for Cursor IDE
         """
-        from datetime import datetime
-
         # Get template directory
         template_dir = Path(__file__).parent / "templates" / "agent_instructions"
 
@@ -274,7 +338,7 @@ class ProjectWorkspace:
         context = {
             "project_name": project_name,
             "stack": stack,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
         }
 
         # Files to create
@@ -285,27 +349,28 @@ class ProjectWorkspace:
         }
 
         for template_name, output_path in agent_files.items():
-            template_path = template_dir / template_name
-
-            if not template_path.exists():
-                print(f"Warning: Template {template_name} not found, skipping")
+            # Read template (cached across calls in this process)
+            template = _load_template(str(template_dir / template_name))
+            if template is None:
+                log.warning("Template %s not found, skipping", template_name)
                 continue
 
-            # Read template
-            template_content = template_path.read_text()
-
-            # Substitute variables
-            content = template_content.format(**context)
-
-            # Write to workspace root (don't overwrite if exists)
-            if output_path.exists():
-                print(f"  ℹ️  {template_name} already exists, skipping")
+            # Render fully before the exclusive create, so a rendering error
+            # never leaves a truncated file that later runs would skip.
+            text = template.format(**context)
+            try:
+                with output_path.open("x") as f:
+                    f.write(text)
+            except FileExistsError:
+                log.info("  ℹ️  %s already exists, skipping", template_name)
             else:
-                output_path.write_text(content)
-                print(f"  ✅ Created {template_name}")
+                log.info("  ✅ Created %s", template_name)
 
     def _ensure_governance_files(self) -> None:
         """Copy governance files into workspace .idse if missing."""
+        if self._governance_root == self.idse_root:
+            return
+
         gov_src_dir = Path(__file__).parent / "governance"
         gov_dst_dir = self.idse_root / "governance"
         gov_dst_dir.mkdir(parents=True, exist_ok=True)
@@ -315,19 +380,29 @@ class ProjectWorkspace:
             src = gov_src_dir / filename
             dst = gov_dst_dir / filename
             if src.exists() and not dst.exists():
-                shutil.copy2(src, dst)
+                copy_small(src, dst)
 
         # Agency Swarm constitution (packaged with orchestrator if present)
         agency_src = gov_src_dir / "AGENCY_SWARM_CONSTITUTION.md"
         agency_dst = gov_dst_dir / "AGENCY_SWARM_CONSTITUTION.md"
         if agency_src.exists() and not agency_dst.exists():
-            shutil.copy2(agency_src, agency_dst)
+            copy_small(agency_src, agency_dst)
 
-    def _install_reference_docs(self) -> None:
-        """Install bundled docs/templates into workspace .idse if missing."""
-        try:
-            from .docs_installer import install_docs
+        self._governance_root = self.idse_root
 
-            install_docs(self.workspace_root, force=False)
+    def _install_reference_docs(self) -> bool:
+        """Install bundled docs/templates into workspace .idse if missing.
+
+        Returns:
+            True if the docs are in place, False if installation failed
+        """
+        root = self.workspace_root.resolve()
+        if root in self._DOCS_INSTALLED:
+            return True
+        try:
+            install_docs(root, force=False)
+            self._DOCS_INSTALLED.add(root)
+            return True
         except Exception as doc_err:
-            print(f"Warning: Failed to install docs/templates: {doc_err}")
+            log.warning("Failed to install docs/templates: %s", doc_err)
+            return False
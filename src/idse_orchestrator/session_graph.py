@@ -8,12 +8,174 @@ from __future__ import annotations
 
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
+import io
+import os
+
+from . import json_codec
+from .fs_utils import (
+    IO_POOL,
+    artifact_writes,
+    make_session_dirs,
+    write_files,
+    write_if_changed,
+)
+from .pipeline_artifacts import PipelineArtifacts
+from .session_metadata import SessionMetadata
+from .stage_state_model import StageStateModel
+
+
+_BLUEPRINT_META_TEMPLATE = """# {project_name} - Blueprint Session Meta
+
+## Session Registry
+
+This document tracks all sessions spawned from this Blueprint.
+
+### Active Sessions
+- `__blueprint__` (THIS SESSION) - Project governance and roadmap
+
+### Feature Sessions
+(To be added as sessions are created)
+
+## Session Status Matrix
+
+| Session ID | Type | Status | Owner | Created | Progress |
+|------------|------|--------|-------|---------|----------|
+| __blueprint__ | blueprint | in_progress | system | {today} | 20% |
+
+## Lineage Graph
+
+```
+__blueprint__ (root)
+├── (no feature sessions yet)
+```
+
+## Governance
+
+This Blueprint defines:
+- Project-level intent and vision
+- Technical architecture constraints
+- Feature roadmap and dependencies
+- Session creation rules
+
+All Feature Sessions inherit from this Blueprint's context and specs.
+
+## Feedback Loop
+
+Feedback from Feature Sessions flows upward to inform Blueprint updates.
+
+---
+*Last updated: {now_iso}*
+"""
+
+# Body of a regenerated meta.md; the "Last updated" footer is appended
+# separately.
+_BLUEPRINT_META_REBUILD_TEMPLATE = """# {project_name} - Blueprint Session Meta
+
+## Session Registry
+
+This document tracks all sessions spawned from this Blueprint.
+
+### Active Sessions
+{registry_section}
+
+## Session Status Matrix
+
+{matrix_section}
+
+## Lineage Graph
+
+```
+__blueprint__ (root)
+```
+
+## Governance
+
+This Blueprint defines:
+- Project-level intent and vision
+- Technical architecture constraints
+- Feature roadmap and dependencies
+- Session creation rules
+
+All Feature Sessions inherit from this Blueprint's context and specs.
+
+## Feedback Loop
+
+Feedback from Feature Sessions flows upward to inform Blueprint updates.
+
+---
+"""
+
+# Append-only registry of sessions, kept next to meta.md. update_blueprint_meta
+# appends one JSON line per new or changed registration; rebuild_blueprint_meta
+# rewrites it from a full scan of session metadata.
+SESSIONS_JOURNAL = "sessions.jsonl"
+
+# Separator row under the status matrix header in meta.md.
+_MATRIX_SEPARATOR = (
+    "|------------|------|--------|-------|---------|----------|"
+)
+
+
+def _journal_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a session.json mapping onto the fields meta.md lists."""
+    return {
+        "id": data["session_id"],
+        "type": data["session_type"],
+        "status": data["status"],
+        "owner": data["owner"],
+        "created_at": data["created_at"],
+        "description": data.get("description"),
+    }
+
+
+def _load_journal_entry(session_dir: Path) -> Optional[Dict[str, Any]]:
+    """Read a session's journal entry from raw session.json, if it has one."""
+    metadata_file = session_dir / "metadata" / "session.json"
+    try:
+        return _journal_entry(json_codec.loads(metadata_file.read_bytes()))
+    except FileNotFoundError:
+        return None
+
+
+def _read_journal(journal: Path) -> Dict[str, Dict[str, Any]]:
+    """Read journal entries by session id; later lines for a session win."""
+    entries: Dict[str, Dict[str, Any]] = {}
+    for line in journal.read_bytes().splitlines():
+        if line.strip():
+            entry = json_codec.loads(line)
+            entries[entry["id"]] = entry
+    return entries
+
+
+def _registry_line(entry: Dict[str, Any]) -> str:
+    if entry["id"] == "__blueprint__":
+        return (
+            "- `__blueprint__` (THIS SESSION) - "
+            "Project governance and roadmap"
+        )
+    description = entry["description"] or "Feature session"
+    return f"- `{entry['id']}` - {description}"
+
+
+def _matrix_row(entry: Dict[str, Any]) -> str:
+    return (
+        f"| {entry['id']} | {entry['type']} | {entry['status']} "
+        f"| {entry['owner']} | {entry['created_at'][:10]} | 0% |"
+    )
+
+
+def _with_footer(body: str) -> str:
+    return f"{body}*Last updated: {datetime.now().isoformat()}*\n"
 
 
 class SessionGraph:
     def __init__(self, project_path: Path):
         self.project_path = project_path
+        # Metadata of sessions created through this graph, so
+        # update_blueprint_meta can journal them without re-reading
+        # session.json.
+        self._created: Dict[Path, SessionMetadata] = {}
 
     def get_current_session(self) -> str:
         try:
@@ -26,8 +188,9 @@ class SessionGraph:
                 db = ArtifactDatabase(idse_root=idse_root, allow_create=False)
                 current = db.get_current_session(self.project_path.name)
                 if current:
-                    current_session_file = self.project_path / "CURRENT_SESSION"
-                    current_session_file.write_text(current)
+                    write_if_changed(
+                        self.project_path / "CURRENT_SESSION", current
+                    )
                     return current
                 raise FileNotFoundError(
                     "Database missing current session. Run 'idse init' or 'idse migrate'."
@@ -43,13 +206,11 @@ class SessionGraph:
         return current_session_file.read_text().strip()
 
     def set_current_session(self, session_id: str) -> None:
-        current_session_file = self.project_path / "CURRENT_SESSION"
-        current_session_file.write_text(session_id)
+        write_if_changed(self.project_path / "CURRENT_SESSION", session_id)
         try:
             from .artifact_config import ArtifactConfig
             from .design_store_sqlite import DesignStoreSQLite
             from .artifact_database import ArtifactDatabase
-            from .stage_state_model import StageStateModel
 
             config = ArtifactConfig()
             if config.get_storage_backend() != "sqlite":
@@ -93,54 +254,22 @@ class SessionGraph:
         blueprint_path = project_path / "sessions" / "__blueprint__"
         meta_file = blueprint_path / "metadata" / "meta.md"
 
-        if meta_file.exists():
-            return
-
-        template = f"""# {project_name} - Blueprint Session Meta
-
-## Session Registry
-
-This document tracks all sessions spawned from this Blueprint.
-
-### Active Sessions
-- `__blueprint__` (THIS SESSION) - Project governance and roadmap
-
-### Feature Sessions
-(To be added as sessions are created)
-
-## Session Status Matrix
-
-| Session ID | Type | Status | Owner | Created | Progress |
-|------------|------|--------|-------|---------|----------|
-| __blueprint__ | blueprint | in_progress | system | {datetime.now().date()} | 20% |
-
-## Lineage Graph
-
-```
-__blueprint__ (root)
-├── (no feature sessions yet)
-```
-
-## Governance
-
-This Blueprint defines:
-- Project-level intent and vision
-- Technical architecture constraints
-- Feature roadmap and dependencies
-- Session creation rules
-
-All Feature Sessions inherit from this Blueprint's context and specs.
-
-## Feedback Loop
-
-Feedback from Feature Sessions flows upward to inform Blueprint updates.
-
----
-*Last updated: {datetime.now().isoformat()}*
-"""
+        now = datetime.now()
+        template = _BLUEPRINT_META_TEMPLATE.format_map(
+            {
+                "project_name": project_name,
+                "today": now.date().isoformat(),
+                "now_iso": now.isoformat(),
+            }
+        )
 
+        # Exclusive create doubles as the "already exists" check.
         meta_file.parent.mkdir(parents=True, exist_ok=True)
-        meta_file.write_text(template)
+        try:
+            with meta_file.open("x") as f:
+                f.write(template)
+        except FileExistsError:
+            return
 
     def create_feature_session(
         self,
@@ -159,46 +288,18 @@ Feedback from Feature Sessions flows upward to inform Blueprint updates.
         if not parent_path.exists():
             raise ValueError(f"Parent session '{parent_session}' does not exist")
 
-        dirs_to_create = [
-            session_path / "intents",
-            session_path / "contexts",
-            session_path / "specs",
-            session_path / "plans",
-            session_path / "tasks",
-            session_path / "implementation",
-            session_path / "feedback",
-            session_path / "metadata",
-        ]
-
-        for dir_path in dirs_to_create:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        now_iso = datetime.now().isoformat()
 
-        from .pipeline_artifacts import PipelineArtifacts
+        # Plain string joins: these paths are only handed to os-level calls.
+        sp = str(session_path)
+        make_session_dirs(sp)
 
         loader = PipelineArtifacts()
         artifacts = loader.load_all_templates(project_name=self.project_path.name, stack="python")
 
-        artifact_map = {
-            "intent.md": session_path / "intents" / "intent.md",
-            "context.md": session_path / "contexts" / "context.md",
-            "spec.md": session_path / "specs" / "spec.md",
-            "plan.md": session_path / "plans" / "plan.md",
-            "tasks.md": session_path / "tasks" / "tasks.md",
-            "feedback.md": session_path / "feedback" / "feedback.md",
-            "implementation_readme.md": session_path / "implementation" / "README.md",
-        }
-
-        for template_name, file_path in artifact_map.items():
-            if template_name in artifacts:
-                file_path.write_text(artifacts[template_name])
-
-        owner_file = session_path / "metadata" / ".owner"
-        owner_file.write_text(f"Created: {datetime.now().isoformat()}\n")
+        owner_text = f"Created: {now_iso}\n"
         if owner:
-            with owner_file.open("a") as f:
-                f.write(f"Owner: {owner}\n")
-
-        from .session_metadata import SessionMetadata
+            owner_text += f"Owner: {owner}\n"
 
         metadata = SessionMetadata(
             session_id=session_id,
@@ -212,12 +313,20 @@ Feedback from Feature Sessions flows upward to inform Blueprint updates.
             collaborators=[],
             tags=[],
             status="draft",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
-        metadata.save(session_path)
 
-        from .stage_state_model import StageStateModel
+        writes = artifact_writes(sp, artifacts)
+        writes.append((os.path.join(sp, "metadata", ".owner"), owner_text))
+        writes.append(
+            (
+                os.path.join(sp, "metadata", "session.json"),
+                metadata.dump_bytes(),
+            )
+        )
+        write_files(writes)
+        self._created[session_path] = metadata
 
         state_tracker = StageStateModel(self.project_path)
         state_tracker.init_state(self.project_path.name, session_id, is_blueprint=False)
@@ -225,48 +334,63 @@ Feedback from Feature Sessions flows upward to inform Blueprint updates.
         return session_path
 
     def update_blueprint_meta(self, project_path: Path, new_session_path: Path) -> None:
-        try:
-            from .artifact_config import ArtifactConfig
-            from .file_view_generator import FileViewGenerator
-
-            config = ArtifactConfig()
-            if config.get_storage_backend() == "sqlite":
-                FileViewGenerator(idse_root=project_path.parent.parent, allow_create=False).generate_blueprint_meta(project_path.name)
-                return
-        except Exception:
-            pass
-
-        from .session_metadata import SessionMetadata
-
-        blueprint_meta = project_path / "sessions" / "__blueprint__" / "metadata" / "meta.md"
-
-        if not blueprint_meta.exists():
-            self.create_blueprint_meta(project_path, project_path.name)
+        if self._generate_sqlite_blueprint_meta(project_path):
+            return
 
-        session_metadata = SessionMetadata.load(new_session_path)
+        metadata_dir = project_path / "sessions" / "__blueprint__" / "metadata"
+        journal = metadata_dir / SESSIONS_JOURNAL
+        if not journal.exists():
+            # No journal yet (legacy project): scan once, which also seeds it.
+            self.rebuild_blueprint_meta(project_path)
+            return
 
-        new_session_entry = f"- `{session_metadata.session_id}` - {session_metadata.description or 'Feature session'}\n"
-        new_row = (
-            f"| {session_metadata.session_id} | {session_metadata.session_type} |"
-            f" {session_metadata.status} | {session_metadata.owner} |"
-            f" {session_metadata.created_at[:10]} | 0% |\n"
-        )
+        created = self._created.pop(new_session_path, None)
+        if created is not None:
+            entry = _journal_entry(created.to_dict())
+        else:
+            entry = _load_journal_entry(new_session_path)
+            if entry is None:
+                raise FileNotFoundError(
+                    f"Session metadata not found: {new_session_path}"
+                )
+        # Journal the entry unless it is already current, then render
+        # meta.md from the journal exactly as a rebuild would.
+        entries = _read_journal(journal)
+        if entries.get(entry["id"]) != entry:
+            with journal.open("ab") as f:
+                f.write(json_codec.dumps_line(entry) + b"\n")
+            entries[entry["id"]] = entry
+        self._write_blueprint_meta(project_path, list(entries.values()))
 
-        content = blueprint_meta.read_text()
+    def rebuild_blueprint_meta(self, project_path: Path) -> None:
+        if self._generate_sqlite_blueprint_meta(project_path):
+            return
 
-        updated = content.replace(
-            "(To be added as sessions are created)",
-            new_session_entry + "(To be added as sessions are created)",
-        )
+        sessions_dir = project_path / "sessions"
+        with os.scandir(sessions_dir) as dir_entries:
+            session_dirs = [Path(e.path) for e in dir_entries if e.is_dir()]
+        # Only the listed fields are needed, so read raw session.json on the
+        # shared pool rather than building full SessionMetadata objects.
+        entries = [
+            entry
+            for entry in IO_POOL.map(_load_journal_entry, session_dirs)
+            if entry is not None
+        ]
 
-        updated = updated.replace(
-            "---\n*Last updated:",
-            f"{new_row}\n---\n*Last updated: {datetime.now().isoformat()}\n*Previous update:",
+        # A full scan is authoritative: compact the journal down to its result.
+        metadata_dir = sessions_dir / "__blueprint__" / "metadata"
+        journal = metadata_dir / SESSIONS_JOURNAL
+        journal.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(
+            journal,
+            "".join(
+                json_codec.dumps_line(entry).decode("utf-8") + "\n"
+                for entry in entries
+            ),
         )
+        self._write_blueprint_meta(project_path, entries)
 
-        blueprint_meta.write_text(updated)
-
-    def rebuild_blueprint_meta(self, project_path: Path) -> None:
+    def _generate_sqlite_blueprint_meta(self, project_path: Path) -> bool:
         try:
             from .artifact_config import ArtifactConfig
             from .file_view_generator import FileViewGenerator
@@ -274,80 +398,54 @@ Feedback from Feature Sessions flows upward to inform Blueprint updates.
             config = ArtifactConfig()
             if config.get_storage_backend() == "sqlite":
                 FileViewGenerator(idse_root=project_path.parent.parent, allow_create=False).generate_blueprint_meta(project_path.name)
-                return
+                return True
         except Exception:
             pass
+        return False
+
+    def _write_blueprint_meta(
+        self, project_path: Path, entries: List[Dict[str, Any]]
+    ) -> None:
+        blueprint_dir = project_path / "sessions" / "__blueprint__"
+        meta_file = blueprint_dir / "metadata" / "meta.md"
+        entries = sorted(
+            entries,
+            key=lambda e: (e["id"] != "__blueprint__", e["created_at"]),
+        )
 
-        from .session_metadata import SessionMetadata
-
-        blueprint_path = project_path / "sessions" / "__blueprint__"
-        meta_file = blueprint_path / "metadata" / "meta.md"
-        sessions_dir = project_path / "sessions"
-
-        sessions = []
-        for session_dir in sessions_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
-            try:
-                meta = SessionMetadata.load(session_dir)
-                sessions.append(meta)
-            except FileNotFoundError:
-                continue
-
-        sessions.sort(key=lambda m: (0 if m.session_id == "__blueprint__" else 1, m.created_at), reverse=False)
-
-        registry_lines = []
-        matrix_rows = []
-        for meta in sessions:
-            if meta.session_id == "__blueprint__":
-                registry_lines.append("- `__blueprint__` (THIS SESSION) - Project governance and roadmap")
-            else:
-                registry_lines.append(f"- `{meta.session_id}` - {meta.description or 'Feature session'}")
-            matrix_rows.append(
-                f"| {meta.session_id} | {meta.session_type} | {meta.status} | {meta.owner} | {meta.created_at[:10]} | 0% |"
-            )
-
-        registry_section = "\n".join(registry_lines) if registry_lines else "(To be added as sessions are created)"
-        matrix_section = "\n".join([
-            "| Session ID | Type | Status | Owner | Created | Progress |",
-            "|------------|------|--------|-------|---------|----------|",
-        ] + matrix_rows)
-
-        content = f"""# {project_path.name} - Blueprint Session Meta
-
-## Session Registry
-
-This document tracks all sessions spawned from this Blueprint.
-
-### Active Sessions
-{registry_section}
-
-## Session Status Matrix
-
-{matrix_section}
-
-## Lineage Graph
-
-```
-__blueprint__ (root)
-```
-
-## Governance
-
-This Blueprint defines:
-- Project-level intent and vision
-- Technical architecture constraints
-- Feature roadmap and dependencies
-- Session creation rules
-
-All Feature Sessions inherit from this Blueprint's context and specs.
-
-## Feedback Loop
-
-Feedback from Feature Sessions flows upward to inform Blueprint updates.
-
----
-*Last updated: {datetime.now().isoformat()}*
-"""
+        # One pass fills both sections; each row goes straight into its
+        # buffer.
+        registry = io.StringIO()
+        matrix = io.StringIO()
+        matrix.write(
+            "| Session ID | Type | Status | Owner | Created | Progress |\n"
+        )
+        matrix.write(_MATRIX_SEPARATOR)
+        for entry in entries:
+            if registry.tell():
+                registry.write("\n")
+            registry.write(_registry_line(entry))
+            matrix.write("\n")
+            matrix.write(_matrix_row(entry))
+
+        registry_section = (
+            registry.getvalue() or "(To be added as sessions are created)"
+        )
+        matrix_section = matrix.getvalue()
+
+        content = _BLUEPRINT_META_REBUILD_TEMPLATE.format_map(
+            {
+                "project_name": project_path.name,
+                "registry_section": registry_section,
+                "matrix_section": matrix_section,
+            }
+        )
+        # Only the "Last updated" footer differs between identical rebuilds;
+        # leave the file untouched unless the body itself changed.
+        try:
+            if meta_file.read_text().startswith(content):
+                return
+        except OSError:
+            pass
         meta_file.parent.mkdir(parents=True, exist_ok=True)
-        meta_file.write_text(content)
+        meta_file.write_text(_with_footer(content))
@@ -4,10 +4,80 @@ Session Manager
 Provides session discovery, search, and lineage tracking capabilities.
 """
 
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
+import os
+
+from . import json_codec
+from .fs_utils import IO_POOL
 from .session_metadata import SessionMetadata
 
+# Above this many sessions, list_sessions parses session.json files on the
+# shared I/O pool; below it the thread hand-off costs more than it saves.
+PARALLEL_LOAD_THRESHOLD = 16
+
+
+@dataclass(frozen=True)
+class SessionSummary:
+    """
+    Lightweight view of a session for listing, search, and statistics.
+
+    Built straight from session.json without Collaborator objects or
+    SessionMetadata validation.
+    """
+
+    session_id: str
+    name: str
+    session_type: str
+    status: str
+    owner: str
+    created_at: str
+    parent_session: Optional[str]
+    is_blueprint: bool
+    tags: Tuple[str, ...]
+    description: Optional[str]
+
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased id, name, and description joined for substring search."""
+        text = f"{self.session_id}\x00{self.name}\x00{self.description or ''}"
+        return text.lower()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionSummary":
+        """Create from a raw session.json mapping."""
+        return cls(
+            session_id=data["session_id"],
+            name=data["name"],
+            session_type=data["session_type"],
+            status=data["status"],
+            owner=data["owner"],
+            created_at=data["created_at"],
+            parent_session=data.get("parent_session"),
+            is_blueprint=data["is_blueprint"],
+            tags=tuple(data.get("tags", ())),
+            description=data.get("description"),
+        )
+
+    @classmethod
+    def from_metadata(cls, metadata: SessionMetadata) -> "SessionSummary":
+        """Create from already-loaded SessionMetadata."""
+        return cls(
+            session_id=metadata.session_id,
+            name=metadata.name,
+            session_type=metadata.session_type,
+            status=metadata.status,
+            owner=metadata.owner,
+            created_at=metadata.created_at,
+            parent_session=metadata.parent_session,
+            is_blueprint=metadata.is_blueprint,
+            tags=tuple(metadata.tags),
+            description=metadata.description,
+        )
+
 
 class SessionManager:
     """
@@ -20,6 +90,36 @@ class SessionManager:
     - Navigate session lineage (parent/children)
     """
 
+    # Managers per resolved project path, most recently used last, so their
+    # caches are shared across callers that do not keep an instance around.
+    _instances: "OrderedDict[Path, SessionManager]" = OrderedDict()
+    _MAX_INSTANCES = 8
+
+    @classmethod
+    def get(cls, project_path: Path) -> "SessionManager":
+        """
+        Return the cached SessionManager for a project, creating one if needed.
+
+        Reusing the instance keeps its metadata caches warm across callers;
+        every cached entry still revalidates against file mtimes. Only the
+        most recently used projects keep a manager.
+
+        Args:
+            project_path: Path to project directory
+
+        Raises:
+            FileNotFoundError: If the project has no sessions directory
+        """
+        key = Path(project_path).resolve()
+        manager = cls._instances.get(key)
+        if manager is None or not manager.sessions_dir.is_dir():
+            manager = cls(project_path)
+            cls._instances[key] = manager
+        cls._instances.move_to_end(key)
+        while len(cls._instances) > cls._MAX_INSTANCES:
+            cls._instances.popitem(last=False)
+        return manager
+
     def __init__(self, project_path: Path):
         """
         Initialize SessionManager.
@@ -29,6 +129,9 @@ class SessionManager:
         """
         self.project_path = project_path
         self.sessions_dir = project_path / "sessions"
+        # session.json path -> (st_mtime_ns, st_size, parsed session.json)
+        self._meta_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+        self._summary_cache: Dict[Path, Tuple[int, int, SessionSummary]] = {}
 
         if not self.sessions_dir.exists():
             raise FileNotFoundError(
@@ -57,24 +160,21 @@ class SessionManager:
         """
         sessions = []
 
-        for session_dir in self.sessions_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
-
-            try:
-                metadata = SessionMetadata.load(session_dir)
-
-                # Apply filters
-                if session_type and metadata.session_type != session_type:
-                    continue
-                if status and metadata.status != status:
-                    continue
-                if tag and tag not in metadata.tags:
-                    continue
-
-                sessions.append(metadata)
-
-            except FileNotFoundError:
+        with os.scandir(self.sessions_dir) as entries:
+            session_dirs = [
+                Path(entry.path) for entry in entries if entry.is_dir()
+            ]
+
+        if len(session_dirs) > PARALLEL_LOAD_THRESHOLD:
+            loaded = list(IO_POOL.map(self._load_cached_or_none, session_dirs))
+        else:
+            loaded = [
+                self._load_cached_or_none(session_dir)
+                for session_dir in session_dirs
+            ]
+
+        for session_dir, metadata in zip(session_dirs, loaded):
+            if metadata is None:
                 # session.json doesn't exist (legacy session)
                 if include_legacy:
                     # Create minimal metadata for legacy session
@@ -83,9 +183,72 @@ class SessionManager:
                         sessions.append(legacy_metadata)
                 continue
 
+            # Apply filters
+            if session_type and metadata.session_type != session_type:
+                continue
+            if status and metadata.status != status:
+                continue
+            if tag and tag not in metadata.tags:
+                continue
+
+            sessions.append(metadata)
+
         # Sort by creation date (newest first)
         return sorted(sessions, key=lambda s: s.created_at, reverse=True)
 
+    def list_session_ids(self) -> List[str]:
+        """
+        List session directory names without reading any metadata.
+
+        Returns:
+            Sorted list of session IDs
+        """
+        with os.scandir(self.sessions_dir) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+
+    def get_session_summaries(
+        self,
+        limit: Optional[int] = None,
+        include_legacy: bool = False
+    ) -> List[SessionSummary]:
+        """
+        List lightweight session summaries.
+
+        Args:
+            limit: Return at most this many summaries
+            include_legacy: Include sessions without session.json
+
+        Returns:
+            List of SessionSummary objects, sorted by creation date
+            (newest first)
+        """
+        return self._summaries_for(
+            self.list_session_ids(), limit, include_legacy
+        )
+
+    def _summaries_for(
+        self,
+        session_ids: List[str],
+        limit: Optional[int] = None,
+        include_legacy: bool = False
+    ) -> List[SessionSummary]:
+        """Build newest-first summaries for already-listed session ids."""
+        summaries = []
+        for session_id in session_ids:
+            session_dir = self.sessions_dir / session_id
+            try:
+                summaries.append(self._load_summary(session_dir))
+            except FileNotFoundError:
+                if include_legacy:
+                    legacy_metadata = self._create_legacy_metadata(session_dir)
+                    if legacy_metadata:
+                        summaries.append(
+                            SessionSummary.from_metadata(legacy_metadata)
+                        )
+
+        summaries.sort(key=lambda s: s.created_at, reverse=True)
+        return summaries if limit is None else summaries[:limit]
+
     def search_sessions(self, query: str) -> List[SessionMetadata]:
         """
         Search sessions by name or description.
@@ -96,18 +259,15 @@ class SessionManager:
         Returns:
             List of matching SessionMetadata objects
         """
-        sessions = self.list_sessions()
         results = []
 
         query_lower = query.lower()
-        for session in sessions:
+        for session in self.get_session_summaries():
             # Search in session_id, name, and description
-            if (
-                query_lower in session.session_id.lower()
-                or query_lower in session.name.lower()
-                or (session.description and query_lower in session.description.lower())
-            ):
-                results.append(session)
+            if query_lower in session.search_text:
+                results.append(
+                    self._load_cached(self.sessions_dir / session.session_id)
+                )
 
         return results
 
@@ -129,7 +289,7 @@ class SessionManager:
         if not session_path.exists():
             raise FileNotFoundError(f"Session '{session_id}' not found")
 
-        return SessionMetadata.load(session_path)
+        return self._load_cached(session_path)
 
     def get_session_lineage(self, session_id: str) -> Dict[str, Any]:
         """
@@ -142,28 +302,25 @@ class SessionManager:
             Dictionary with 'session', 'parent', and 'children' keys
         """
         session_path = self.sessions_dir / session_id
-        metadata = SessionMetadata.load(session_path)
+        metadata = self._load_cached(session_path)
 
         # Find parent
         parent = None
         if metadata.parent_session:
             try:
                 parent_path = self.sessions_dir / metadata.parent_session
-                parent = SessionMetadata.load(parent_path)
+                parent = self._load_cached(parent_path)
             except FileNotFoundError:
                 # Parent session doesn't exist (orphaned)
                 pass
 
         # Find children
         children = []
-        for session_dir in self.sessions_dir.iterdir():
-            if not session_dir.is_dir() or session_dir.name == session_id:
-                continue
-
+        for child_id in self._get_children_index().get(session_id, []):
             try:
-                child_metadata = SessionMetadata.load(session_dir)
-                if child_metadata.parent_session == session_id:
-                    children.append(child_metadata)
+                children.append(
+                    self._load_cached(self.sessions_dir / child_id)
+                )
             except FileNotFoundError:
                 continue
 
@@ -172,7 +329,7 @@ class SessionManager:
         for related_id in metadata.related_sessions:
             try:
                 related_path = self.sessions_dir / related_id
-                related_metadata = SessionMetadata.load(related_path)
+                related_metadata = self._load_cached(related_path)
                 related.append(related_metadata)
             except FileNotFoundError:
                 continue
@@ -191,6 +348,15 @@ class SessionManager:
         Returns:
             SessionMetadata for blueprint, or None if not found
         """
+        # The blueprint lives at a fixed path; only scan if it was placed
+        # elsewhere.
+        try:
+            blueprint = self._load_cached(self.sessions_dir / "__blueprint__")
+            if blueprint.session_type == "blueprint":
+                return blueprint
+        except FileNotFoundError:
+            pass
+
         sessions = self.list_sessions(session_type="blueprint")
         if sessions:
             return sessions[0]  # Should only be one blueprint per project
@@ -213,13 +379,17 @@ class SessionManager:
             List of orphaned SessionMetadata objects
         """
         orphaned = []
-        all_sessions = self.list_sessions()
-
-        for session in all_sessions:
-            if session.parent_session:
-                parent_path = self.sessions_dir / session.parent_session
-                if not parent_path.exists():
-                    orphaned.append(session)
+        # One directory listing serves as both the scan and the existence
+        # index.
+        session_ids = self.list_session_ids()
+        existing = set(session_ids)
+
+        for session in self._summaries_for(session_ids):
+            parent = session.parent_session
+            if parent and parent not in existing:
+                orphaned.append(
+                    self._load_cached(self.sessions_dir / session.session_id)
+                )
 
         return orphaned
 
@@ -277,7 +447,12 @@ class SessionManager:
         Returns:
             Dictionary with session counts and statistics
         """
-        all_sessions = self.list_sessions(include_legacy=True)
+        # One directory listing feeds every count below. Orphan detection
+        # checks parents against the directories themselves, as
+        # get_orphaned_sessions does, not against readable session.json files.
+        session_ids = self.list_session_ids()
+        existing = set(session_ids)
+        all_sessions = self._summaries_for(session_ids, include_legacy=True)
 
         stats = {
             "total_sessions": len(all_sessions),
@@ -285,11 +460,19 @@ class SessionManager:
             "by_status": {},
             "blueprint_count": 0,
             "feature_count": 0,
-            "orphaned_count": len(self.get_orphaned_sessions()),
-            "legacy_count": len([s for s in all_sessions if "legacy" in s.tags])
+            "orphaned_count": 0,
+            "legacy_count": 0
         }
 
         for session in all_sessions:
+            if "legacy" in session.tags:
+                stats["legacy_count"] += 1
+            elif (
+                session.parent_session
+                and session.parent_session not in existing
+            ):
+                stats["orphaned_count"] += 1
+
             # Count by type
             stats["by_type"][session.session_type] = stats["by_type"].get(session.session_type, 0) + 1
 
@@ -304,6 +487,76 @@ class SessionManager:
 
         return stats
 
+    def _load_cached(self, session_dir: Path) -> SessionMetadata:
+        """
+        Load session metadata, reusing the last parse while session.json is
+        unchanged.
+
+        Only the parsed mapping is cached; every call returns a new
+        SessionMetadata, so one caller's edits never leak into another's.
+
+        Raises:
+            FileNotFoundError: If session.json doesn't exist
+        """
+        metadata_file = session_dir / "metadata" / "session.json"
+        st = os.stat(metadata_file)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cached = self._meta_cache.get(metadata_file)
+        if cached is not None and cached[:2] == stat_key:
+            return SessionMetadata.from_dict(cached[2])
+
+        data = json_codec.loads(metadata_file.read_bytes())
+        self._meta_cache[metadata_file] = (st.st_mtime_ns, st.st_size, data)
+        return SessionMetadata.from_dict(data)
+
+    def _load_cached_or_none(
+        self, session_dir: Path
+    ) -> Optional[SessionMetadata]:
+        """Like ``_load_cached`` but return None without a session.json."""
+        try:
+            return self._load_cached(session_dir)
+        except FileNotFoundError:
+            return None
+
+    def _load_summary(self, session_dir: Path) -> SessionSummary:
+        """
+        Load a session summary, reusing cached parses while session.json is
+        unchanged.
+
+        Raises:
+            FileNotFoundError: If session.json doesn't exist
+        """
+        metadata_file = session_dir / "metadata" / "session.json"
+        st = os.stat(metadata_file)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cached = self._summary_cache.get(metadata_file)
+        if cached is not None and cached[:2] == stat_key:
+            return cached[2]
+
+        full = self._meta_cache.get(metadata_file)
+        if full is not None and full[:2] == stat_key:
+            data = full[2]
+        else:
+            data = json_codec.loads(metadata_file.read_bytes())
+        summary = SessionSummary.from_dict(data)
+        self._summary_cache[metadata_file] = (*stat_key, summary)
+        return summary
+
+    def _get_children_index(self) -> Dict[str, List[str]]:
+        """
+        Return the parent -> children index, newest child first.
+
+        Built from the session summaries, which are re-read whenever a
+        session.json's stat changes, so re-parenting a session or migrating
+        its metadata is picked up without hydrating every session.
+        """
+        index: Dict[str, List[str]] = {}
+        for session in self._summaries_for(self.list_session_ids()):
+            parent = session.parent_session
+            if parent and parent != session.session_id:
+                index.setdefault(parent, []).append(session.session_id)
+        return index
+
     def __repr__(self) -> str:
         """String representation."""
         return f"SessionManager(project='{self.project_path.name}', sessions_dir='{self.sessions_dir}')"
@@ -8,13 +8,22 @@ from dataclasses import dataclass, asdict
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pathlib import Path
-import json
+
+from . import json_codec
+from .fs_utils import atomic_write_bytes
+
+VALID_SESSION_TYPES = ["blueprint", "feature", "exploratory"]
+VALID_STATUSES = ["draft", "in_progress", "review", "complete", "archived"]
+VALID_ROLES = ["owner", "contributor", "reviewer", "viewer"]
 
 
 @dataclass
 class Collaborator:
     """Represents a collaborator on a session."""
 
+    # No per-instance __dict__: sessions can carry many collaborators.
+    __slots__ = ("name", "role", "joined_at")
+
     name: str
     role: str  # owner, contributor, reviewer, viewer
     joined_at: str
@@ -30,11 +39,7 @@ class Collaborator:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Collaborator":
         """Create from dictionary."""
-        return cls(
-            name=data["name"],
-            role=data["role"],
-            joined_at=data["joined_at"]
-        )
+        return cls(data["name"], data["role"], data["joined_at"])
 
 
 @dataclass
@@ -66,23 +71,35 @@ class SessionMetadata:
 
     def __post_init__(self):
         """Validate session metadata after initialization."""
-        valid_types = ["blueprint", "feature", "exploratory"]
-        if self.session_type not in valid_types:
+        self.validate()
+
+    def validate(self) -> None:
+        """
+        Check session type, status, and collaborator roles.
+
+        Runs on construction, including every ``load``/``from_dict``, and
+        before saving user edits.
+
+        Raises:
+            ValueError: If any field holds an unknown value
+        """
+        if self.session_type not in VALID_SESSION_TYPES:
             raise ValueError(
-                f"Invalid session_type: {self.session_type}. Must be one of {valid_types}"
+                f"Invalid session_type: {self.session_type}. "
+                f"Must be one of {VALID_SESSION_TYPES}"
             )
 
-        valid_statuses = ["draft", "in_progress", "review", "complete", "archived"]
-        if self.status not in valid_statuses:
+        if self.status not in VALID_STATUSES:
             raise ValueError(
-                f"Invalid status: {self.status}. Must be one of {valid_statuses}"
+                f"Invalid status: {self.status}. "
+                f"Must be one of {VALID_STATUSES}"
             )
 
-        valid_roles = ["owner", "contributor", "reviewer", "viewer"]
         for collab in self.collaborators:
-            if collab.role not in valid_roles:
+            if collab.role not in VALID_ROLES:
                 raise ValueError(
-                    f"Invalid collaborator role: {collab.role}. Must be one of {valid_roles}"
+                    f"Invalid collaborator role: {collab.role}. "
+                    f"Must be one of {VALID_ROLES}"
                 )
 
     @classmethod
@@ -99,47 +116,72 @@ class SessionMetadata:
         Raises:
             FileNotFoundError: If session.json doesn't exist
             json.JSONDecodeError: If session.json is malformed
+            ValueError: If session.json holds an unknown type, status, or role
         """
         metadata_file = session_path / "metadata" / "session.json"
 
-        if not metadata_file.exists():
+        # Read directly (one open) and decode the bytes with orjson when
+        # available.
+        try:
+            raw = metadata_file.read_bytes()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Session metadata not found: {metadata_file}\n"
                 f"This may be a legacy session. Run migration to upgrade."
-            )
+            ) from None
+
+        return cls.from_dict(json_codec.loads(raw))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionMetadata":
+        """
+        Create from a parsed session.json mapping.
 
-        with open(metadata_file, "r") as f:
-            data = json.load(f)
+        The instance copies every mutable field, so ``data`` is never
+        modified and may be shared, e.g. by a parse cache.
 
+        Raises:
+            ValueError: If ``data`` holds an unknown type, status, or role
+        """
         # Convert collaborators from dict to Collaborator objects
+        raw_collaborators = data.get("collaborators") or []
         collaborators = []
-        for c in data.get("collaborators", []):
+        for c in raw_collaborators:
             if isinstance(c, dict):
-                collaborators.append(Collaborator.from_dict(c))
+                collaborators.append(
+                    Collaborator(c["name"], c["role"], c["joined_at"])
+                )
             elif isinstance(c, str):
                 # Handle legacy string collaborators (e.g., ["Claude"])
                 collaborators.append(Collaborator(
                     name=c,
                     role="contributor",
-                    joined_at=data.get("created_at", datetime.now().isoformat())
+                    joined_at=(
+                        data.get("created_at") or datetime.now().isoformat()
+                    ),
                 ))
             # else: skip invalid entries
 
-        return cls(
+        # Construct normally so __post_init__ validates: session.json may have
+        # been written by hand, by older versions, or by migration.
+        metadata = cls(
             session_id=data["session_id"],
             name=data["name"],
             session_type=data["session_type"],
             description=data.get("description"),
             is_blueprint=data["is_blueprint"],
             parent_session=data.get("parent_session"),
-            related_sessions=data.get("related_sessions", []),
+            related_sessions=list(data.get("related_sessions", [])),
             owner=data["owner"],
             collaborators=collaborators,
-            tags=data.get("tags", []),
+            tags=list(data.get("tags", [])),
             status=data["status"],
             created_at=data["created_at"],
-            updated_at=data["updated_at"]
+            updated_at=data["updated_at"],
         )
+        # Last persisted state; lets update() skip no-op writes.
+        metadata.__dict__["_clean_state"] = data
+        return metadata
 
     def save(self, session_path: Path) -> None:
         """
@@ -151,27 +193,14 @@ class SessionMetadata:
         metadata_dir = session_path / "metadata"
         metadata_dir.mkdir(parents=True, exist_ok=True)
 
-        metadata_file = metadata_dir / "session.json"
+        # Rename a fully written temp file over session.json so a crash never
+        # leaves a torn file behind.
+        atomic_write_bytes(metadata_dir / "session.json", self.dump_bytes())
+        self._mark_clean()
 
-        # Convert to dictionary
-        data = {
-            "session_id": self.session_id,
-            "name": self.name,
-            "session_type": self.session_type,
-            "description": self.description,
-            "is_blueprint": self.is_blueprint,
-            "parent_session": self.parent_session,
-            "related_sessions": self.related_sessions,
-            "owner": self.owner,
-            "collaborators": [c.to_dict() for c in self.collaborators],
-            "tags": self.tags,
-            "status": self.status,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at
-        }
-
-        with open(metadata_file, "w") as f:
-            json.dump(data, f, indent=2)
+    def dump_bytes(self) -> bytes:
+        """Serialize to the exact bytes written to session.json."""
+        return json_codec.dumps(self.to_dict())
 
     def update(self, session_path: Path, **kwargs) -> None:
         """
@@ -179,17 +208,44 @@ class SessionMetadata:
 
         Args:
             session_path: Path to session directory
-            **kwargs: Fields to update
+            **kwargs: Fields to update. An explicit ``updated_at`` is used as
+                the new timestamp instead of reading the clock again.
         """
+        timestamp = kwargs.pop("updated_at", None)
         for key, value in kwargs.items():
             if hasattr(self, key):
                 setattr(self, key, value)
 
+        # Nothing changed since the last load/save: skip the timestamp bump
+        # and write
+        if not self._is_dirty():
+            return
+
         # Always update timestamp
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = timestamp or datetime.now().isoformat()
 
+        self.validate()
         self.save(session_path)
 
+    def _mark_clean(self) -> None:
+        """Snapshot the persisted state, with private copies of its lists."""
+        state = self.to_dict()
+        state["related_sessions"] = list(self.related_sessions)
+        state["tags"] = list(self.tags)
+        self.__dict__["_clean_state"] = state
+
+    def _is_dirty(self) -> bool:
+        """Return True if a field besides updated_at changed since save."""
+        clean = self.__dict__.get("_clean_state")
+        if clean is None:
+            return True
+        state = self.to_dict()
+        return any(
+            state[key] != clean.get(key)
+            for key in state
+            if key != "updated_at"
+        )
+
     def add_collaborator(
         self,
         session_path: Path,
@@ -207,15 +263,23 @@ class SessionMetadata:
         # Check if collaborator already exists
         if any(c.name == name for c in self.collaborators):
             raise ValueError(f"Collaborator {name} already exists")
+        if role not in VALID_ROLES:
+            raise ValueError(
+                f"Invalid collaborator role: {role}. "
+                f"Must be one of {VALID_ROLES}"
+            )
 
+        now_iso = datetime.now().isoformat()
         collaborator = Collaborator(
             name=name,
             role=role,
-            joined_at=datetime.now().isoformat()
+            joined_at=now_iso
         )
 
         self.collaborators.append(collaborator)
-        self.update(session_path, collaborators=self.collaborators)
+        self.update(
+            session_path, collaborators=self.collaborators, updated_at=now_iso
+        )
 
     def remove_collaborator(self, session_path: Path, name: str) -> None:
         """
@@ -6,16 +6,95 @@ Manages session_state.json for tracking pipeline stage progress.
 
 from __future__ import annotations
 
-import json
+import contextlib
+import copy
+import mmap
+import os
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple, Union
 from datetime import datetime
 
+from . import json_codec
+from .design_store import DesignStoreFilesystem
+from .fs_utils import atomic_write_bytes
+
+# (epoch second, isoformat of that second) reused by _iso_now within a second.
+# Replaced as a whole tuple so concurrent readers never see a torn pair.
+_ISO_SECOND: Tuple[Optional[int], str] = (None, "")
+
+
+def _iso_now() -> str:
+    """Return the local time as an ISO 8601 string with microseconds."""
+    global _ISO_SECOND
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ISO_SECOND
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec).isoformat()
+        _ISO_SECOND = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+
+STAGE_NAMES = (
+    "intent",
+    "context",
+    "spec",
+    "plan",
+    "tasks",
+    "implementation",
+    "feedback",
+)
+_STAGE_SET = frozenset(STAGE_NAMES)
+_STAGE_STATUSES = frozenset({"pending", "in_progress", "completed"})
+# Copied into each new state by init_state.
+_DEFAULT_STAGES: Dict[str, str] = dict.fromkeys(STAGE_NAMES, "pending")
+
+# Stage artifact locations relative to a session directory, taken from the
+# design store's layout and joined as strings so auto_detect_stage_completion
+# does not build Path objects per stage.
+_STAGE_ARTIFACT_PATHS = tuple(
+    (stage, os.path.join(*DesignStoreFilesystem.STAGE_PATHS[stage]))
+    for stage in STAGE_NAMES
+)
+
+_REQUIRES_INPUT_MARKER = b"[REQUIRES INPUT]"
+# Longest UTF-8 encoding of one character (a CRLF pair reads as one, too).
+_MAX_BYTES_PER_CHAR = 4
+# Marks StageStateModel._current_stage as not yet computed (None is a valid
+# value).
+_UNSET = object()
+# State files at least this large are parsed straight from a read-only mmap;
+# below it the mapping costs more than the copy it saves.
+_MMAP_MIN_SIZE = 4096
+
+
+def _file_contains(
+    path: Union[str, Path], needle: bytes, chunk_size: int = 64 * 1024
+) -> bool:
+    """Scan ``path`` in chunks for ``needle``, stopping at the first hit."""
+    overlap = len(needle) - 1
+    tail = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return False
+            if needle in tail + chunk:
+                return True
+            tail = chunk[-overlap:]
+
+
+def _first_incomplete_stage(state: Dict) -> Optional[str]:
+    for stage in STAGE_NAMES:
+        if state["stages"][stage] != "completed":
+            return stage
+    return None
+
 
 class StageStateModel:
     """Tracks IDSE pipeline stage progression and sync state."""
 
-    STAGE_NAMES = ["intent", "context", "spec", "plan", "tasks", "implementation", "feedback"]
+    STAGE_NAMES = STAGE_NAMES
 
     def __init__(
         self,
@@ -38,6 +117,16 @@ class StageStateModel:
             self.state_file = project_path / "session_state.json"
         else:
             self.state_file = None
+        # Last state read from or written to state_file, keyed by its
+        # (st_mtime_ns, st_size) so external edits invalidate it.
+        self._state_cache: Optional[Dict] = None
+        self._state_stat: Optional[Tuple[int, int]] = None
+        self._state_payload: Optional[bytes] = None
+        # Pending state held back by batch() until the outermost block exits.
+        self._batch_depth = 0
+        self._batch_state: Optional[Dict] = None
+        self._session_id_resolved = False
+        self._current_stage = _UNSET
 
     def init_state(self, project_name: str, session_id: str, is_blueprint: bool = False) -> Dict:
         """
@@ -60,15 +149,36 @@ class StageStateModel:
             "project_name": project_name,
             "session_id": session_id,
             "is_blueprint": is_blueprint,
-            "stages": {stage: "pending" for stage in self.STAGE_NAMES},
+            "stages": _DEFAULT_STAGES.copy(),
             "last_sync": None,
             "validation_status": "unknown",
-            "created_at": datetime.now().isoformat(),
+            "created_at": _iso_now(),
         }
 
         self._write_state(state)
         return state
 
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["StageStateModel"]:
+        """
+        Defer state writes until the outermost ``with tracker.batch():`` exits.
+
+        Reads inside the block see the pending state. Nothing is written if
+        the block raises.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batch_depth == 1:
+                self._batch_state = None
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_state is not None:
+            state, self._batch_state = self._batch_state, None
+            self._write_state(state)
+
     def update_stage(self, stage: str, status: str) -> None:
         """
         Update the status of a pipeline stage.
@@ -77,10 +187,10 @@ class StageStateModel:
             stage: Stage name (intent, context, spec, plan, tasks, implementation, feedback)
             status: New status (pending, in_progress, completed)
         """
-        if stage not in self.STAGE_NAMES:
+        if stage not in _STAGE_SET:
             raise ValueError(f"Unknown stage: {stage}")
 
-        if status not in ["pending", "in_progress", "completed"]:
+        if status not in _STAGE_STATUSES:
             raise ValueError(f"Invalid status: {status}")
 
         state = self._read_state()
@@ -99,13 +209,15 @@ class StageStateModel:
         Returns:
             Stage name or None if all completed
         """
-        state = self._read_state()
-
-        for stage in self.STAGE_NAMES:
-            if state["stages"][stage] != "completed":
-                return stage
+        if self._batch_state is not None or (self.store and self.project_name):
+            return _first_incomplete_stage(self._read_state())
 
-        return None
+        # Memoized alongside the cached file state, so polling an unchanged
+        # state file costs one stat.
+        state = self._cached_file_state()
+        if self._current_stage is _UNSET:
+            self._current_stage = _first_incomplete_stage(state)
+        return self._current_stage
 
     def mark_synced(self, timestamp: Optional[str] = None) -> None:
         """
@@ -118,7 +230,7 @@ class StageStateModel:
             timestamp: ISO format timestamp. Defaults to now.
         """
         state = self._read_state()
-        state["last_sync"] = timestamp or datetime.now().isoformat()
+        state["last_sync"] = timestamp or _iso_now()
         self._write_state(state)
 
     def get_status(self, project_name: Optional[str] = None) -> Dict:
@@ -132,6 +244,8 @@ class StageStateModel:
             Status dictionary with project info and stage progression
         """
         if not self.state_file or not self.state_file.exists():
+            # Imported here rather than at module level: project_workspace and
+            # session_graph both import this module while they initialize.
             from .project_workspace import ProjectWorkspace
 
             manager = ProjectWorkspace()
@@ -153,57 +267,103 @@ class StageStateModel:
                 return self.store.load_session_state(self.project_name, self.session_id)
             return self.store.load_state(self.project_name)
 
-        if not self.state_file or not self.state_file.exists():
-            raise FileNotFoundError("No session_state.json found. Run 'idse init' first.")
-
-        return self._read_state()
+        missing = FileNotFoundError(
+            "No session_state.json found. Run 'idse init' first."
+        )
+        if not self.state_file:
+            raise missing
+        try:
+            return self._read_state()
+        except FileNotFoundError:
+            raise missing from None
 
     def auto_detect_stage_completion(self, session_path: Path) -> None:
         """
         Auto-detect stage completion based on artifact presence and content.
 
+        An artifact over 100 characters is in progress; over 200 characters
+        with no [REQUIRES INPUT] marker, it is completed. A character takes
+        at most four bytes, so the file size alone settles both thresholds
+        except for files of 101-800 bytes, which are read and measured in
+        characters.
+
         Args:
             session_path: Path to session directory
         """
-        state = self._read_state()
-
-        artifact_map = {
-            "intent": session_path / "intents" / "intent.md",
-            "context": session_path / "contexts" / "context.md",
-            "spec": session_path / "specs" / "spec.md",
-            "plan": session_path / "plans" / "plan.md",
-            "tasks": session_path / "tasks" / "tasks.md",
-            "implementation": session_path / "implementation" / "README.md",
-            "feedback": session_path / "feedback" / "feedback.md",
-        }
-
-        for stage, artifact_path in artifact_map.items():
-            if artifact_path.exists():
-                content = artifact_path.read_text()
-
-                if len(content) > 200 and "[REQUIRES INPUT]" not in content:
-                    state["stages"][stage] = "completed"
-                elif len(content) > 100:
-                    state["stages"][stage] = "in_progress"
-
-        self._write_state(state)
+        with self.batch():
+            for stage, relative in _STAGE_ARTIFACT_PATHS:
+                artifact_path = os.path.join(session_path, relative)
+                try:
+                    size = os.stat(artifact_path).st_size
+                except OSError:
+                    continue
+                if size <= 100:
+                    continue
+
+                if size <= 200 * _MAX_BYTES_PER_CHAR:
+                    content = Path(artifact_path).read_text()
+                    chars = len(content)
+                    if chars > 200 and "[REQUIRES INPUT]" not in content:
+                        self.update_stage(stage, "completed")
+                    elif chars > 100:
+                        self.update_stage(stage, "in_progress")
+                elif not _file_contains(artifact_path, _REQUIRES_INPUT_MARKER):
+                    self.update_stage(stage, "completed")
+                else:
+                    self.update_stage(stage, "in_progress")
 
     def _read_state(self) -> Dict:
         """Read state from JSON file."""
+        if self._batch_state is not None:
+            return copy.deepcopy(self._batch_state)
         if self.store and self.project_name:
             self._resolve_session_id()
             if hasattr(self.store, "load_session_state") and self.session_id:
                 return self.store.load_session_state(self.project_name, self.session_id)
             return self.store.load_state(self.project_name)
 
-        if not self.state_file or not self.state_file.exists():
-            raise FileNotFoundError(f"State file not found: {self.state_file}")
+        state = self._cached_file_state()
+        if self._state_payload is not None:
+            # Re-parsing the cached bytes is several times faster than
+            # deepcopy.
+            return json_codec.loads(self._state_payload)
+        return copy.deepcopy(state)
 
-        with self.state_file.open("r") as f:
-            return json.load(f)
+    def _cached_file_state(self) -> Dict:
+        """Return the parsed state file, re-read only when its stat changes.
+
+        The returned dict is the cache itself; callers must not mutate it.
+        """
+        missing = f"State file not found: {self.state_file}"
+        if not self.state_file:
+            raise FileNotFoundError(missing)
+        try:
+            st = self.state_file.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(missing) from None
+
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if self._state_cache is not None and self._state_stat == stat_key:
+            return self._state_cache
+
+        payload = None
+        with self.state_file.open("rb") as f:
+            if st.st_size < _MMAP_MIN_SIZE:
+                payload = f.read()
+                state = json_codec.loads(payload)
+            else:
+                with mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm, memoryview(mm) as view:
+                    state = json_codec.loads(view)
+        self._cache_state(state, st, payload)
+        return state
 
     def _write_state(self, state: Dict) -> None:
         """Write state to JSON file."""
+        if self._batch_depth:
+            self._batch_state = state
+            return
         if self.store and self.project_name:
             self._resolve_session_id()
             if hasattr(self.store, "save_session_state") and self.session_id:
@@ -217,17 +377,33 @@ class StageStateModel:
         if not self.state_file:
             raise ValueError("State file path not set")
 
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with self.state_file.open("w") as f:
-            json.dump(state, f, indent=2)
+        self._write_state_file(state)
 
     def _write_state_file(self, state: Dict) -> None:
         if not self.state_file:
             return
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.state_file.open("w") as f:
-            json.dump(state, f, indent=2)
+        # Rename a fully written sibling over the state file so readers never
+        # see a partial document.
+        payload = json_codec.dumps(state)
+        try:
+            atomic_write_bytes(self.state_file, payload)
+        except FileNotFoundError:
+            # Only the first write (or one after the directory was removed)
+            # needs to create the project directory.
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(self.state_file, payload)
+        self._cache_state(
+            json_codec.loads(payload), self.state_file.stat(), payload
+        )
+
+    def _cache_state(
+        self, state: Dict, st: os.stat_result, payload: Optional[bytes]
+    ) -> None:
+        """Cache ``state`` (and its bytes, when known) as the file contents."""
+        self._state_cache = state
+        self._state_payload = payload
+        self._state_stat = (st.st_mtime_ns, st.st_size)
+        self._current_stage = _UNSET
 
     def refresh_state_file(self) -> None:
         state = self._read_state()
@@ -240,8 +416,15 @@ class StageStateModel:
         self._write_state_file(state)
 
     def _resolve_session_id(self) -> None:
-        if self.session_id or not self.project_path:
+        # Look up the current session at most once per instance; reads and
+        # writes both call this on every state access.
+        if (
+            self.session_id
+            or self._session_id_resolved
+            or not self.project_path
+        ):
             return
+        self._session_id_resolved = True
         try:
             from .session_graph import SessionGraph
 
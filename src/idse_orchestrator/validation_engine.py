@@ -7,10 +7,89 @@ Validates IDSE pipeline artifacts for constitutional compliance.
 from __future__ import annotations
 
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional
 import re
 
+from .artifact_config import ArtifactConfig
+from .artifact_database import ArtifactDatabase
 from .constitution_rules import REQUIRED_SECTIONS
+from .design_store import DesignStoreFilesystem
+from .design_store_sqlite import DesignStoreSQLite
+from .fs_utils import IO_POOL
+from .project_workspace import ProjectWorkspace
+from .session_graph import SessionGraph
+from .stage_state_model import StageStateModel
+
+# Fenced code blocks, then inline code spans, removed in a single scan.
+_CODE_RE = re.compile(r"```[\s\S]*?```|`[^`]*`")
+# "- **Name**" component bullet. It is deliberately unanchored so the search is
+# driven by the literal "-"; _has_component_bullet checks the line start.
+_COMPONENT_BULLET_RE = re.compile(r"-\s*\*\*[^*]+\*\*")
+# Validated artifacts, in report order, with the pipeline stage each is
+# stored under.
+_ARTIFACT_STAGES = MappingProxyType(
+    {
+        "intent.md": "intent",
+        "context.md": "context",
+        "spec.md": "spec",
+        "plan.md": "plan",
+        "tasks.md": "tasks",
+        "implementation.md": "implementation",
+        "feedback.md": "feedback",
+    }
+)
+_ARTIFACT_STAGE_NAMES = tuple(_ARTIFACT_STAGES.values())
+# Artifact name -> location relative to the session directory, from the
+# filesystem design store's layout.
+_ARTIFACT_PATHS = {
+    artifact: DesignStoreFilesystem.STAGE_PATHS[stage]
+    for artifact, stage in _ARTIFACT_STAGES.items()
+}
+# Text following a "#"/"##" heading marker, up to the end of that line.
+_HEADING_RE = re.compile(r"##?\s+(.*)")
+# artifact -> ((section, lowercased section), ...) for case-insensitive lookup.
+_SECTION_KEYS = {
+    artifact: tuple((section, section.lower()) for section in sections)
+    for artifact, sections in REQUIRED_SECTIONS.items()
+}
+
+
+def _heading_text(content: str) -> str:
+    """Collect heading text in one scan; each section check is a substring.
+
+    Equivalent to searching ``##?\\s+.*<section>`` case-insensitively for every
+    section, which would rescan ``content`` once per section. Only the heading
+    text is case-folded, so the section keys are lowered once at import.
+    """
+    return "\n".join(_HEADING_RE.findall(content)).lower()
+
+
+def _read_text_or_none(path: Path) -> Optional[str]:
+    """Read ``path``; a missing file yields None (the existence check)."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _has_component_bullet(content: str, start: int = 0) -> bool:
+    """Return True if a line starts (after whitespace) with "- **Name**".
+
+    Matches what ``^\\s*-\\s*\\*\\*[^*]+\\*\\*`` finds with re.MULTILINE, but
+    the MULTILINE anchor makes that search try every position in the text.
+    ``start`` is where bullets are expected (the impact report heading); the
+    scan begins there and only goes back to the top when nothing follows it.
+    """
+    for pos in (start, 0) if start > 0 else (0,):
+        match = _COMPONENT_BULLET_RE.search(content, pos)
+        while match:
+            dash = match.start()
+            line_start = content.rfind("\n", 0, dash) + 1
+            if not content[line_start:dash].strip():
+                return True
+            match = _COMPONENT_BULLET_RE.search(content, dash + 1)
+    return False
 
 
 class ValidationEngine:
@@ -50,13 +129,6 @@ class ValidationEngine:
                 "warnings": List[str]
             }
         """
-        from .project_workspace import ProjectWorkspace
-        from .session_graph import SessionGraph
-        from .stage_state_model import StageStateModel
-        from .artifact_config import ArtifactConfig
-        from .artifact_database import ArtifactDatabase
-        from .design_store_sqlite import DesignStoreSQLite
-
         manager = ProjectWorkspace()
         if project_name:
             project_path = manager.projects_root / project_name
@@ -90,102 +162,79 @@ class ValidationEngine:
         errors: List[str] = []
         warnings: List[str] = []
 
-        artifacts = ["intent.md", "context.md", "spec.md", "plan.md", "tasks.md", "implementation.md", "feedback.md"]
-        artifact_stage_map = {
-            "intent.md": "intent",
-            "context.md": "context",
-            "spec.md": "spec",
-            "plan.md": "plan",
-            "tasks.md": "tasks",
-            "implementation.md": "implementation",
-            "feedback.md": "feedback",
-        }
+        # One pass over the artifacts runs every per-artifact check. Marker and
+        # section results are held back so the report keeps its grouping:
+        # existence, then markers, then implementation rules, then sections.
+        marker_checks: List[str] = []
+        marker_errors: List[str] = []
+        section_checks: List[str] = []
+        implementation_content = None
+        loaded = self._load_contents(
+            db, project_name, session_id, session_path
+        )
+        for artifact, content in zip(_ARTIFACT_STAGES, loaded):
+            if content is None:
+                errors.append(f"{artifact} is missing")
+                continue
+            checks.append(f"{artifact} exists")
 
-        for artifact in artifacts:
-            if use_db and db:
-                stage = artifact_stage_map[artifact]
-                try:
-                    db.load_artifact(project_name, session_id, stage)
-                    checks.append(f"{artifact} exists")
-                except FileNotFoundError:
-                    errors.append(f"{artifact} is missing")
-            else:
-                artifact_path = self._get_artifact_path(session_path, artifact)
-                if artifact_path.exists():
-                    checks.append(f"{artifact} exists")
-                else:
-                    errors.append(f"{artifact} is missing")
-
-        for artifact in artifacts:
-            content = None
-            if use_db and db:
-                stage = artifact_stage_map[artifact]
-                try:
-                    content = db.load_artifact(project_name, session_id, stage).content
-                except FileNotFoundError:
-                    content = None
+            # Stripping code only removes text, so the regex pass is needed
+            # only when the raw content has a marker at all.
+            if (
+                "[REQUIRES INPUT]" in content
+                and "[REQUIRES INPUT]" in self._strip_code(content)
+            ):
+                marker_errors.append(
+                    f"{artifact} contains [REQUIRES INPUT] markers"
+                )
             else:
-                artifact_path = self._get_artifact_path(session_path, artifact)
-                if artifact_path.exists():
-                    content = artifact_path.read_text()
+                marker_checks.append(
+                    f"{artifact} has no [REQUIRES INPUT] markers"
+                )
 
-            if content is not None:
-                scan_text = self._strip_code(content)
-                if "[REQUIRES INPUT]" in scan_text:
-                    errors.append(f"{artifact} contains [REQUIRES INPUT] markers")
-                else:
-                    checks.append(f"{artifact} has no [REQUIRES INPUT] markers")
+            section_keys = _SECTION_KEYS.get(artifact)
+            if section_keys:
+                headings = _heading_text(content)
+                section_checks.extend(
+                    f"{artifact} has section: {section}"
+                    for section, key in section_keys
+                    if key in headings
+                )
+                warnings.extend(
+                    f"{artifact} missing recommended section: {section}"
+                    for section, key in section_keys
+                    if key not in headings
+                )
+
+            if artifact == "implementation.md":
+                implementation_content = content
+
+        checks.extend(marker_checks)
+        errors.extend(marker_errors)
 
         # Additional enforcement for implementation artifacts:
         # block unresolved scaffolds and require a structured impact section.
-        implementation_content = None
-        if use_db and db:
-            try:
-                implementation_content = db.load_artifact(project_name, session_id, "implementation").content
-            except FileNotFoundError:
-                implementation_content = None
-        else:
-            impl_path = self._get_artifact_path(session_path, "implementation.md")
-            if impl_path.exists():
-                implementation_content = impl_path.read_text()
-
         if implementation_content is not None:
-            if "## Component Impact Report" not in implementation_content:
+            impact_at = implementation_content.find(
+                "## Component Impact Report"
+            )
+            if impact_at < 0:
                 errors.append("implementation.md missing '## Component Impact Report' section")
             else:
                 checks.append("implementation.md has section: Component Impact Report")
 
-            for marker in self.IMPLEMENTATION_PLACEHOLDERS:
-                if marker in implementation_content:
-                    errors.append(f"implementation.md contains placeholder content: {marker}")
+            for marker in self._placeholders_in(implementation_content):
+                errors.append(
+                    "implementation.md contains placeholder content: "
+                    f"{marker}"
+                )
 
-            component_bullet = re.search(r"^\s*-\s*\*\*[^*]+\*\*", implementation_content, re.MULTILINE)
-            if not component_bullet:
+            if not _has_component_bullet(implementation_content, impact_at):
                 errors.append("implementation.md has no component entries in Component Impact Report")
             else:
                 checks.append("implementation.md has component entries")
 
-        for artifact, required_sections in REQUIRED_SECTIONS.items():
-            content = None
-            if use_db and db:
-                stage = artifact_stage_map.get(artifact)
-                if stage:
-                    try:
-                        content = db.load_artifact(project_name, session_id, stage).content
-                    except FileNotFoundError:
-                        content = None
-            else:
-                artifact_path = self._get_artifact_path(session_path, artifact)
-                if artifact_path.exists():
-                    content = artifact_path.read_text()
-
-            if content is not None:
-                for section in required_sections:
-                    pattern = rf"##?\s+.*{re.escape(section)}"
-                    if re.search(pattern, content, re.IGNORECASE):
-                        checks.append(f"{artifact} has section: {section}")
-                    else:
-                        warnings.append(f"{artifact} missing recommended section: {section}")
+        checks.extend(section_checks)
 
         results = {
             "valid": len(errors) == 0,
@@ -209,23 +258,57 @@ class ValidationEngine:
 
         return results
 
+    def _load_contents(
+        self,
+        db: Optional[ArtifactDatabase],
+        project_name: str,
+        session_id: str,
+        session_path: Path,
+    ) -> List[Optional[str]]:
+        """Return the content of every validated artifact, None where missing.
+
+        The backend is chosen once here so the check loop never branches on it.
+        """
+        if db is not None:
+            records = db.load_artifacts(
+                project_name, session_id, _ARTIFACT_STAGE_NAMES
+            )
+            return [
+                records[stage].content if stage in records else None
+                for stage in _ARTIFACT_STAGE_NAMES
+            ]
+        # The reads are independent, so overlap them on the shared I/O pool.
+        paths = [
+            self._get_artifact_path(session_path, artifact)
+            for artifact in _ARTIFACT_STAGES
+        ]
+        return list(IO_POOL.map(_read_text_or_none, paths))
+
     def _get_artifact_path(self, session_path: Path, artifact_name: str) -> Path:
-        artifact_map = {
-            "intent.md": session_path / "intents" / "intent.md",
-            "context.md": session_path / "contexts" / "context.md",
-            "spec.md": session_path / "specs" / "spec.md",
-            "plan.md": session_path / "plans" / "plan.md",
-            "tasks.md": session_path / "tasks" / "tasks.md",
-            "implementation.md": session_path / "implementation" / "README.md",
-            "feedback.md": session_path / "feedback" / "feedback.md",
-        }
+        relative = _ARTIFACT_PATHS.get(artifact_name)
+        if relative is None:
+            return session_path / artifact_name
+        return session_path.joinpath(*relative)
 
-        return artifact_map.get(artifact_name, session_path / artifact_name)
+    def _placeholders_in(self, content: str) -> List[str]:
+        """Return the implementation placeholders in ``content``, in order.
+
+        The Jinja-style markers share a "{{" prefix, so a single probe for it
+        skips their scans in the usual case where none are left.
+        """
+        has_jinja = "{{" in content
+        return [
+            marker
+            for marker in self.IMPLEMENTATION_PLACEHOLDERS
+            if (has_jinja or not marker.startswith("{{")) and marker in content
+        ]
 
     def _strip_code(self, content: str) -> str:
-        """Remove fenced code blocks and inline code spans before scanning."""
-        # Remove fenced code blocks
-        content = re.sub(r"```[\\s\\S]*?```", "", content)
-        # Remove inline code spans
-        content = re.sub(r"`[^`]*`", "", content)
-        return content
+        """Remove fenced code blocks and inline code spans before scanning.
+
+        Both kinds start with a backtick, so content without one is returned
+        as is and never reaches the regex engine.
+        """
+        if "`" not in content:
+            return content
+        return _CODE_RE.sub("", content)
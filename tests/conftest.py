@@ -1 +1,61 @@
-# Intentionally minimal; reserved for shared fixtures.
+# Shared fixtures for the test suite.
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+import pytest
+
+from idse_orchestrator.session_manager import SessionManager
+from idse_orchestrator.session_metadata import SessionMetadata
+
+
+def _session_fields(session_id: str, created_at: str, **overrides: Any) -> Dict[str, Any]:
+    is_blueprint = session_id == "__blueprint__"
+    fields = dict(
+        session_id=session_id,
+        name=session_id,
+        session_type="blueprint" if is_blueprint else "feature",
+        description=None,
+        is_blueprint=is_blueprint,
+        parent_session=None if is_blueprint else "__blueprint__",
+        related_sessions=[],
+        owner="system",
+        collaborators=[],
+        tags=[],
+        status="draft",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    fields.update(overrides)
+    return fields
+
+
+@pytest.fixture(autouse=True)
+def _reset_session_managers() -> Iterator[None]:
+    """Start and end each test without shared SessionManager instances."""
+    SessionManager._instances.clear()
+    yield
+    SessionManager._instances.clear()
+
+
+@pytest.fixture
+def make_metadata() -> Callable[..., SessionMetadata]:
+    """Build valid SessionMetadata; keyword overrides replace any field."""
+
+    def make(
+        session_id: str = "feature-a", created_at: str = "2026-02-01T00:00:00", **overrides: Any
+    ) -> SessionMetadata:
+        return SessionMetadata(**_session_fields(session_id, created_at, **overrides))
+
+    return make
+
+
+@pytest.fixture
+def write_session(make_metadata: Callable[..., SessionMetadata]) -> Callable[..., Path]:
+    """Save a session's session.json under ``project_path/sessions`` and return its path."""
+
+    def write(project_path: Path, session_id: str, created_at: str, **overrides: Any) -> Path:
+        session_path = project_path / "sessions" / session_id
+        make_metadata(session_id, created_at, **overrides).save(session_path)
+        return session_path
+
+    return write
@@ -60,6 +60,35 @@ def test_artifact_database_crud(tmp_path: Path) -> None:
     assert db.load_state(project) == state
 
 
+def test_load_artifacts_fetches_requested_stages(tmp_path: Path) -> None:
+    db = ArtifactDatabase(idse_root=tmp_path / ".idse")
+    db.save_artifacts("demo", "s1", {"intent": "i", "spec": "s", "plan": "p"})
+    db.save_artifact("demo", "s2", "intent", "other session")
+
+    records = db.load_artifacts("demo", "s1", ["intent", "spec", "feedback"])
+    assert sorted(records) == ["intent", "spec"]
+    assert records["intent"] == db.load_artifact("demo", "s1", "intent")
+    assert db.load_artifacts("demo", "s1", []) == {}
+
+
+def test_transaction_batches_writes_and_rolls_back(tmp_path: Path) -> None:
+    db = ArtifactDatabase(idse_root=tmp_path / ".idse")
+
+    with db.transaction():
+        db.ensure_session("demo", "session-1")
+        db.save_artifacts("demo", "session-1", {"intent": "alpha", "spec": "beta"})
+    assert db.load_artifact("demo", "session-1", "spec").content == "beta"
+    assert db.load_artifact("demo", "session-1", "intent").idse_id == "demo::session-1::intent"
+
+    try:
+        with db.transaction():
+            db.save_artifacts("demo", "session-2", {"intent": "gamma"})
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert "session-2" not in db.list_sessions("demo")
+
+
 def test_save_session_state_does_not_reset_session_status(tmp_path: Path) -> None:
     idse_root = tmp_path / ".idse"
     db = ArtifactDatabase(idse_root=idse_root)
@@ -21,3 +21,26 @@ def test_design_store_filesystem_crud(tmp_path: Path):
     state = {"project_name": project, "session_id": session}
     store.save_state(project, state)
     assert store.load_state(project) == state
+
+
+def test_design_store_filesystem_push_artifacts(tmp_path: Path):
+    store = DesignStoreFilesystem(tmp_path)
+    artifacts = {stage: f"# {stage}\n" for stage in store.STAGE_PATHS}
+    artifacts["unknown"] = "ignored"
+
+    pushed = store.push_artifacts("demo", "s1", artifacts)
+    assert pushed == list(store.STAGE_PATHS)
+    for stage in pushed:
+        assert store.load_artifact("demo", "s1", stage) == f"# {stage}\n"
+    assert store.push_artifacts("demo", "s1", {"intent": "only"}) == ["intent"]
+    assert store.load_artifact("demo", "s1", "intent") == "only"
+
+
+def test_design_store_filesystem_pull_artifacts_skips_missing(tmp_path: Path):
+    store = DesignStoreFilesystem(tmp_path)
+    store.save_artifact("demo", "s1", "spec", "spec body")
+    store.save_artifact("demo", "s1", "intent", "intent body")
+
+    assert store.pull_artifacts("demo", "s1") == {"intent": "intent body", "spec": "spec body"}
+    assert list(store.pull_artifacts("demo", "s1")) == ["intent", "spec"]
+    assert store.pull_artifacts("demo", "s1", ["spec", "bogus", "plan"]) == {"spec": "spec body"}
@@ -0,0 +1,21 @@
+import logging
+from pathlib import Path
+
+from idse_orchestrator.framework_installer import install_agency_swarm
+
+
+def test_install_agency_swarm_reports_only_through_logging(tmp_path: Path, monkeypatch, capsys, caplog) -> None:
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    # CLI tests may already have attached the console echo handler.
+    monkeypatch.setattr(logging.getLogger("idse_orchestrator"), "handlers", [])
+
+    with caplog.at_level(logging.INFO, logger="idse_orchestrator"):
+        install_agency_swarm(project_path, "python")
+
+    assert capsys.readouterr().out == ""
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Installing Agency Swarm framework resources" in messages[0]
+    assert "Next steps:" in messages[-1]
+    assert (project_path / "metadata" / "framework.json").exists()
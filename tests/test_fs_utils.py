@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from idse_orchestrator.fs_utils import (
+    SESSION_SUBDIRS,
+    artifact_writes,
+    make_session_dirs,
+    read_files,
+    write_files,
+)
+
+
+def test_session_scaffold_round_trips_through_pool(tmp_path: Path) -> None:
+    session_path = tmp_path / "sessions" / "feature-a"
+    make_session_dirs(session_path)
+    make_session_dirs(session_path)
+    assert sorted(p.name for p in session_path.iterdir()) == sorted(SESSION_SUBDIRS)
+
+    writes = artifact_writes(session_path, {"spec.md": "# Spec\n", "intent.md": "# Intent ✓\n"})
+    write_files(writes)
+
+    assert [Path(path).name for path, _ in writes] == ["intent.md", "spec.md"]
+    assert read_files([path for path, _ in writes]) == ["# Intent ✓\n", "# Spec\n"]
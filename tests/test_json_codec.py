@@ -0,0 +1,42 @@
+import json
+
+from idse_orchestrator import json_codec
+
+
+def test_round_trip_matches_stdlib_layout() -> None:
+    data = {"session_id": "s1", "tags": ["a", "b"], "parent_session": None}
+    encoded = json_codec.dumps(data)
+    assert encoded.decode("utf-8") == json.dumps(data, indent=2)
+    assert json_codec.loads(encoded) == data
+
+
+def test_stdlib_fallback(monkeypatch) -> None:
+    monkeypatch.setattr(json_codec, "orjson", None)
+    data = {"stages": {"intent": "pending"}}
+    assert json_codec.loads(json_codec.dumps(data)) == data
+
+
+def test_loads_accepts_memoryview(monkeypatch) -> None:
+    payload = json_codec.dumps({"a": [1, 2]})
+    assert json_codec.loads(memoryview(payload)) == {"a": [1, 2]}
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert json_codec.loads(memoryview(payload)) == {"a": [1, 2]}
+
+
+def test_dumps_line_is_compact_and_backend_independent(monkeypatch) -> None:
+    data = {"id": "feature-é", "description": None, "tags": ["a"]}
+    encoded = json_codec.dumps_line(data)
+    assert b"\n" not in encoded
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert json_codec.dumps_line(data) == encoded
+    assert json_codec.loads(encoded) == data
+
+
+def test_dumps_writes_raw_utf8_with_either_backend(monkeypatch) -> None:
+    data = {"name": "Zoë", "description": "日本語 ✓"}
+    encoded = json_codec.dumps(data)
+    assert "Zoë".encode("utf-8") in encoded
+    assert json_codec.loads(encoded) == data
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert json_codec.dumps(data) == encoded
+    assert json_codec.loads(json_codec.dumps(data)) == data
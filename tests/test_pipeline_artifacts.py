@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from idse_orchestrator.pipeline_artifacts import _TEMPLATE_CACHE, PipelineArtifacts, _has_markdown_files
+
+
+def test_load_all_templates_renders_cached_raw_templates(tmp_path: Path) -> None:
+    (tmp_path / "intent-template.md").write_text("# Intent for {{project_name}} ({{stack}})\n")
+    loader = PipelineArtifacts(templates_dir=tmp_path)
+
+    first = loader.load_all_templates(project_name="demo", stack="go")
+    assert first["intent.md"] == "# Intent for demo (go)\n"
+    assert "[REQUIRES INPUT]" in first["spec.md"]
+    assert _TEMPLATE_CACHE[str(tmp_path / "intent-template.md")][1].startswith("# Intent")
+
+    # Raw template text is cached by path; rendering still applies the new context.
+    second = loader.load_all_templates(project_name="other", stack="go")
+    assert second["intent.md"] == "# Intent for other (go)\n"
+
+    # Editing the template changes its stat, which invalidates the cached text.
+    (tmp_path / "intent-template.md").write_text("changed\n")
+    assert loader.load_all_templates(project_name="demo")["intent.md"] == "changed\n"
+
+
+def test_substitute_replaces_known_placeholders_in_one_pass() -> None:
+    loader = PipelineArtifacts(templates_dir=None)
+    context = {"project_name": "{{stack}}", "stack": "go", "timestamp": "T", "date": "D"}
+    rendered = loader._substitute("{{project_name}}/{{stack}} {{date}}@{{timestamp}} {{owner}}", context)
+    assert rendered == "{{stack}}/go D@T {{owner}}"
+
+
+def test_has_markdown_files(tmp_path: Path) -> None:
+    assert not _has_markdown_files(tmp_path / "missing")
+    (tmp_path / "notes.txt").write_text("x")
+    assert not _has_markdown_files(tmp_path)
+    (tmp_path / "intent-template.md").write_text("x")
+    assert _has_markdown_files(tmp_path)
+    assert not _has_markdown_files(tmp_path / "notes.txt")
+
+
+def test_load_template_compiles_each_template_once(tmp_path: Path) -> None:
+    (tmp_path / "intent-template.md").write_text("# {{ project_name }}\n")
+    loader = PipelineArtifacts(templates_dir=tmp_path)
+    assert loader._env is None
+
+    assert loader.load_template("intent-template.md", project_name="demo") == "# demo\n"
+    compiled = loader._compiled["intent-template.md"]
+    assert loader.load_template("intent-template.md", project_name="other") == "# other\n"
+    assert loader._compiled["intent-template.md"] is compiled
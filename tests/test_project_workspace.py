@@ -0,0 +1,88 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from idse_orchestrator.project_workspace import ProjectWorkspace, _load_template
+
+
+def test_get_current_project_prefers_marker_with_multiple_projects(tmp_path: Path, monkeypatch) -> None:
+    projects_root = tmp_path / ".idse" / "projects"
+    (projects_root / "alpha").mkdir(parents=True)
+    (projects_root / "beta").mkdir()
+    (projects_root / "CURRENT_PROJECT").write_text("beta\n")
+    nested = tmp_path / "src" / "pkg"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+
+    workspace = ProjectWorkspace()
+    assert workspace.get_current_project() == projects_root / "beta"
+    assert workspace.workspace_root == tmp_path
+    # Repeat lookups reuse the memoized workspace root.
+    assert workspace.get_current_project() == projects_root / "beta"
+
+
+def test_get_current_project_single_project(tmp_path: Path, monkeypatch) -> None:
+    projects_root = tmp_path / ".idse" / "projects"
+    (projects_root / "only").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+
+    assert ProjectWorkspace().get_current_project() == projects_root / "only"
+
+
+def test_get_current_project_ignores_stale_marker(tmp_path: Path, monkeypatch) -> None:
+    projects_root = tmp_path / ".idse" / "projects"
+    (projects_root / "alpha").mkdir(parents=True)
+    (projects_root / "beta").mkdir()
+    (projects_root / "CURRENT_PROJECT").write_text("gone\n")
+    monkeypatch.chdir(tmp_path)
+
+    assert ProjectWorkspace().get_current_project() in {projects_root / "alpha", projects_root / "beta"}
+
+
+def test_create_agent_instructions_renders_with_str_format(tmp_path: Path, monkeypatch) -> None:
+    template = tmp_path / "T.md"
+    template.write_text("# {project_name}\n{{literal}} on {stack!s:>4} at {timestamp}\n")
+    monkeypatch.setattr(
+        "idse_orchestrator.project_workspace._load_template", lambda path: _load_template(str(template))
+    )
+    workspace = ProjectWorkspace(tmp_path)
+
+    workspace._create_agent_instructions("demo", "py", timestamp="now")
+    assert (tmp_path / "CLAUDE.md").read_text() == "# demo\n{literal} on   py at now\n"
+    assert _load_template(str(tmp_path / "missing.md")) is None
+
+
+def test_create_agent_instructions_leaves_no_partial_file_on_render_error(tmp_path: Path, monkeypatch) -> None:
+    broken = tmp_path / "broken.md"
+    broken.write_text("# {project_name}\n" + "filler\n" * 1000 + "{unknown_field}\n")
+    monkeypatch.setattr(
+        "idse_orchestrator.project_workspace._load_template", lambda path: _load_template(str(broken))
+    )
+    workspace = ProjectWorkspace(tmp_path)
+
+    with pytest.raises(KeyError):
+        workspace._create_agent_instructions("demo", "python")
+    assert not (tmp_path / "CLAUDE.md").exists()
+
+
+def test_cleanup_nested_idse_removes_only_existing_dir(tmp_path: Path) -> None:
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    (project_path / ".idse" / "governance").mkdir(parents=True)
+    workspace = ProjectWorkspace(tmp_path)
+
+    assert workspace.cleanup_nested_idse(project_path) is True
+    assert not (project_path / ".idse").exists()
+    assert workspace.cleanup_nested_idse(project_path) is False
+
+
+def test_library_warnings_reach_stderr_without_logging_config() -> None:
+    script = (
+        "import logging, idse_orchestrator.project_workspace as pw\n"
+        "pw.log.info('quiet progress')\n"
+        "pw.log.warning('Template %s not found, skipping', 'CLAUDE.md')\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout == ""
+    assert result.stderr == "Template CLAUDE.md not found, skipping\n"
@@ -0,0 +1,147 @@
+from pathlib import Path
+
+from idse_orchestrator.session_graph import SessionGraph
+from idse_orchestrator.session_metadata import SessionMetadata
+
+
+def test_update_blueprint_meta_rebuilds_registry(tmp_path: Path, monkeypatch, write_session) -> None:
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    graph = SessionGraph(project_path)
+    graph.create_blueprint_meta(project_path, "demo")
+
+    first = write_session(project_path, "feature-a", "2026-02-02T00:00:00", description="First")
+    graph.update_blueprint_meta(project_path, first)
+    second = write_session(project_path, "feature-b", "2026-02-03T00:00:00")
+    graph.update_blueprint_meta(project_path, second)
+
+    meta = (project_path / "sessions" / "__blueprint__" / "metadata" / "meta.md").read_text()
+    assert "- `feature-a` - First" in meta
+    assert "- `feature-b` - Feature session" in meta
+    assert meta.count("| feature-a |") == 1
+    assert "*Previous update:" not in meta
+
+
+def test_rebuild_blueprint_meta_skips_unchanged_body(tmp_path: Path, monkeypatch, write_session) -> None:
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    graph = SessionGraph(project_path)
+    meta_path = project_path / "sessions" / "__blueprint__" / "metadata" / "meta.md"
+
+    graph.rebuild_blueprint_meta(project_path)
+    first = meta_path.read_text()
+    graph.rebuild_blueprint_meta(project_path)
+    assert meta_path.read_text() == first
+
+    write_session(project_path, "feature-a", "2026-02-02T00:00:00")
+    graph.rebuild_blueprint_meta(project_path)
+    assert "| feature-a |" in meta_path.read_text()
+
+
+def test_update_blueprint_meta_appends_to_session_journal(tmp_path: Path, monkeypatch, write_session) -> None:
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    graph = SessionGraph(project_path)
+    graph.rebuild_blueprint_meta(project_path)
+
+    journal = project_path / "sessions" / "__blueprint__" / "metadata" / "sessions.jsonl"
+    assert len(journal.read_text().splitlines()) == 1
+
+    feature = write_session(project_path, "feature-a", "2026-02-02T00:00:00")
+    graph.update_blueprint_meta(project_path, feature)
+    feature_meta = SessionMetadata.load(feature)
+    feature_meta.update(feature, status="in_progress")
+    graph.update_blueprint_meta(project_path, feature)
+
+    assert len(journal.read_text().splitlines()) == 3
+    meta = (project_path / "sessions" / "__blueprint__" / "metadata" / "meta.md").read_text()
+    assert "| feature-a | feature | in_progress |" in meta
+    assert meta.count("| feature-a |") == 1
+
+    graph.rebuild_blueprint_meta(project_path)
+    assert len(journal.read_text().splitlines()) == 2
+
+
+def test_create_feature_session_writes_session_json(tmp_path: Path, monkeypatch, write_session) -> None:
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    session_path = SessionGraph(project_path).create_feature_session("feature-a", owner="dev")
+
+    metadata = SessionMetadata.load(session_path)
+    assert metadata.owner == "dev"
+    assert metadata.parent_session == "__blueprint__"
+    assert (session_path / "metadata" / "session.json").read_bytes() == metadata.dump_bytes()
+
+
+def test_update_blueprint_meta_reuses_created_session_metadata(tmp_path: Path, monkeypatch, write_session) -> None:
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    graph = SessionGraph(project_path)
+    graph.rebuild_blueprint_meta(project_path)
+
+    session_path = graph.create_feature_session("feature-a", description="Spawned")
+    (session_path / "metadata" / "session.json").unlink()
+    graph.update_blueprint_meta(project_path, session_path)
+
+    meta = (project_path / "sessions" / "__blueprint__" / "metadata" / "meta.md").read_text()
+    assert "- `feature-a` - Spawned" in meta
+
+
+def test_update_blueprint_meta_matches_rebuild(tmp_path: Path, monkeypatch, write_session) -> None:
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    graph = SessionGraph(project_path)
+    graph.rebuild_blueprint_meta(project_path)
+
+    # Same-day sessions registered out of creation order, with multi-line
+    # descriptions that are later replaced.
+    late = write_session(project_path, "feature-b", "2026-02-02T18:00:00", description="line1\nline2")
+    early = write_session(project_path, "feature-a", "2026-02-02T09:00:00", description="Ünïcode")
+    graph.update_blueprint_meta(project_path, late)
+    graph.update_blueprint_meta(project_path, early)
+    SessionMetadata.load(late).update(late, description="new\ndesc")
+    graph.update_blueprint_meta(project_path, late)
+    meta_path = project_path / "sessions" / "__blueprint__" / "metadata" / "meta.md"
+    updated = meta_path.read_text()
+
+    meta_path.unlink()
+    graph.rebuild_blueprint_meta(project_path)
+    rebuilt = meta_path.read_text()
+    assert updated.rsplit("*Last updated:", 1)[0] == rebuilt.rsplit("*Last updated:", 1)[0]
+    assert "line2" not in updated
+    assert updated.index("| feature-a |") < updated.index("| feature-b |")
+
+
+def test_update_blueprint_meta_lists_reregistered_session_once(tmp_path: Path, monkeypatch, write_session) -> None:
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    project_path = tmp_path / ".idse" / "projects" / "demo"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    graph = SessionGraph(project_path)
+    graph.rebuild_blueprint_meta(project_path)
+    metadata_dir = project_path / "sessions" / "__blueprint__" / "metadata"
+
+    feature_a = write_session(project_path, "feature-a", "2026-02-02T00:00:00")
+    feature_b = write_session(project_path, "feature-b", "2026-02-03T00:00:00")
+    graph.update_blueprint_meta(project_path, feature_a)
+    graph.update_blueprint_meta(project_path, feature_b)
+    journal_before = (metadata_dir / "sessions.jsonl").read_bytes()
+    meta_before = (metadata_dir / "meta.md").read_text()
+
+    graph.update_blueprint_meta(project_path, feature_a)
+    graph.update_blueprint_meta(project_path, feature_a)
+    assert (metadata_dir / "sessions.jsonl").read_bytes() == journal_before
+    assert (metadata_dir / "meta.md").read_text() == meta_before
+
+    SessionMetadata.load(feature_a).update(feature_a, status="review", description="Renamed")
+    graph.update_blueprint_meta(project_path, feature_a)
+    meta = (metadata_dir / "meta.md").read_text()
+    assert meta.count("feature-a") == 2
+    assert "- `feature-a` - Renamed\n- `feature-b` - Feature session" in meta
+    assert "| feature-a | feature | review |" in meta
+    assert len((metadata_dir / "sessions.jsonl").read_text().splitlines()) == 4
@@ -1,5 +1,8 @@
+import gc
 from pathlib import Path
 
+import pytest
+
 from idse_orchestrator.session_manager import SessionManager
 
 
@@ -19,3 +22,157 @@ def test_legacy_session_uses_valid_status_for_statistics(tmp_path: Path):
     stats = manager.get_statistics()
     assert stats["total_sessions"] == 1
     assert stats["by_status"]["draft"] == 1
+
+
+def test_load_cached_reuses_parse_until_session_json_changes(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    session_path = write_session(project_path, "feature-a", "2026-02-01T00:00:00")
+    manager = SessionManager(project_path)
+
+    first = manager.get_session("feature-a")
+    cached = manager._meta_cache[session_path / "metadata" / "session.json"]
+    assert manager.get_session("feature-a") == first
+    assert manager._meta_cache[session_path / "metadata" / "session.json"] is cached
+
+    first.update(session_path, status="in_progress", description="changed size")
+    reloaded = manager.get_session("feature-a")
+    assert manager._meta_cache[session_path / "metadata" / "session.json"] is not cached
+    assert reloaded.status == "in_progress"
+
+
+def test_load_cached_returns_independent_instances(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    session_path = write_session(project_path, "feature-a", "2026-02-01T00:00:00", tags=["auth"])
+    manager = SessionManager(project_path)
+
+    first = manager.get_session("feature-a")
+    with pytest.raises(ValueError, match="Invalid status"):
+        first.update(session_path, status="bogus")
+    first.tags.append("scratch")
+
+    again = manager.get_session("feature-a")
+    assert again is not first
+    assert again.status == "draft"
+    assert again.tags == ["auth"]
+
+
+def test_statistics_counts_orphans_in_single_scan(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    write_session(project_path, "feature-a", "2026-02-02T00:00:00")
+    write_session(project_path, "feature-b", "2026-02-03T00:00:00", parent_session="missing")
+
+    stats = SessionManager(project_path).get_statistics()
+    assert stats["total_sessions"] == 3
+    assert stats["orphaned_count"] == 1
+    assert stats["blueprint_count"] == 1
+    assert stats["feature_count"] == 2
+    assert stats["legacy_count"] == 0
+
+
+def test_statistics_orphans_match_orphan_api_for_parent_without_metadata(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    (project_path / "sessions" / "__blueprint__").mkdir(parents=True)
+    write_session(project_path, "feature-a", "2026-02-02T00:00:00")
+    manager = SessionManager(project_path)
+
+    assert manager.get_orphaned_sessions() == []
+    assert manager.get_statistics()["orphaned_count"] == 0
+
+
+def test_session_lineage_uses_children_index(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    write_session(project_path, "feature-a", "2026-02-02T00:00:00")
+    manager = SessionManager(project_path)
+
+    lineage = manager.get_session_lineage("__blueprint__")
+    assert [c.session_id for c in lineage["children"]] == ["feature-a"]
+
+    write_session(project_path, "feature-b", "2026-02-03T00:00:00")
+    children = manager.get_session_lineage("__blueprint__")["children"]
+    assert sorted(c.session_id for c in children) == ["feature-a", "feature-b"]
+    assert manager.get_session_lineage("feature-a")["parent"].session_id == "__blueprint__"
+
+
+def test_session_lineage_follows_reparented_session(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    write_session(project_path, "f0", "2026-02-02T00:00:00")
+    f1_path = write_session(project_path, "f1", "2026-02-03T00:00:00")
+    manager = SessionManager(project_path)
+    assert manager.get_session_lineage("f0")["children"] == []
+
+    # Re-parenting rewrites session.json but leaves sessions/ untouched.
+    manager.get_session("f1").update(f1_path, parent_session="f0")
+
+    assert [c.session_id for c in manager.get_session_lineage("f0")["children"]] == ["f1"]
+    blueprint_children = manager.get_session_lineage("__blueprint__")["children"]
+    assert [c.session_id for c in blueprint_children] == ["f0"]
+
+
+def test_session_summaries_and_ids_skip_full_hydration(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    write_session(project_path, "feature-a", "2026-02-02T00:00:00", description="Login flow", tags=["auth"])
+    write_session(project_path, "feature-b", "2026-02-03T00:00:00", parent_session="missing")
+    manager = SessionManager(project_path)
+
+    assert manager.list_session_ids() == ["__blueprint__", "feature-a", "feature-b"]
+
+    summaries = manager.get_session_summaries()
+    assert [s.session_id for s in summaries] == ["feature-b", "feature-a", "__blueprint__"]
+    assert summaries[1].tags == ("auth",)
+    assert [s.session_id for s in manager.get_session_summaries(limit=1)] == ["feature-b"]
+
+    assert [s.session_id for s in manager.search_sessions("login")] == ["feature-a"]
+    assert [s.session_id for s in manager.get_orphaned_sessions()] == ["feature-b"]
+
+
+def test_get_blueprint_session_loads_fixed_path(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    write_session(project_path, "__blueprint__", "2026-02-01T00:00:00")
+    write_session(project_path, "feature-a", "2026-02-02T00:00:00")
+    manager = SessionManager(project_path)
+
+    assert manager.get_blueprint_session().session_id == "__blueprint__"
+    assert manager._meta_cache.keys() == {project_path / "sessions" / "__blueprint__" / "metadata" / "session.json"}
+
+
+def test_get_shares_manager_per_project(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    write_session(project_path, "feature-a", "2026-02-01T00:00:00")
+
+    manager = SessionManager.get(project_path)
+    assert SessionManager.get(project_path / ".." / "project") is manager
+    assert SessionManager.get(tmp_path / "project") is manager
+
+
+def test_get_keeps_recent_managers_without_caller_references(tmp_path: Path, write_session):
+    projects = [tmp_path / f"project-{i}" for i in range(SessionManager._MAX_INSTANCES + 1)]
+    for project_path in projects:
+        write_session(project_path, "feature-a", "2026-02-01T00:00:00")
+
+    SessionManager.get(projects[0]).get_session("feature-a")
+    gc.collect()
+    assert SessionManager.get(projects[0])._meta_cache
+
+    for project_path in projects[1:]:
+        SessionManager.get(project_path)
+    assert not SessionManager.get(projects[0])._meta_cache
+    assert len(SessionManager._instances) == SessionManager._MAX_INSTANCES
+
+
+def test_list_sessions_parallel_scan_matches_serial(tmp_path: Path, write_session):
+    project_path = tmp_path / "project"
+    for i in range(20):
+        write_session(project_path, f"feature-{i:02d}", f"2026-02-{i + 1:02d}T00:00:00", status="review" if i % 2 else "draft")
+    legacy = project_path / "sessions" / "legacy-session" / "metadata"
+    legacy.mkdir(parents=True)
+    (legacy / ".owner").write_text("Created: 2026-01-01T00:00:00\n")
+    manager = SessionManager(project_path)
+
+    sessions = manager.list_sessions()
+    assert [s.session_id for s in sessions] == [f"feature-{i:02d}" for i in reversed(range(20))]
+    assert len(manager.list_sessions(status="review")) == 10
+    assert manager.list_sessions(include_legacy=True)[-1].session_id == "legacy-session"
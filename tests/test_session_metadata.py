@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from idse_orchestrator.session_metadata import SessionMetadata
+
+
+def test_load_round_trips_and_validates_on_disk_metadata(tmp_path: Path, make_metadata) -> None:
+    session_path = tmp_path / "feature-a"
+    original = make_metadata(tags=["auth"])
+    original.save(session_path)
+
+    loaded = SessionMetadata.load(session_path)
+    assert loaded == original
+
+    metadata_file = session_path / "metadata" / "session.json"
+    metadata_file.write_text(metadata_file.read_text().replace('"draft"', '"bogus"'))
+    with pytest.raises(ValueError, match="Invalid status"):
+        SessionMetadata.load(session_path)
+
+
+def test_validation_runs_on_construction_and_user_edits(tmp_path: Path, make_metadata) -> None:
+    with pytest.raises(ValueError, match="Invalid status"):
+        make_metadata(status="bogus")
+
+    session_path = tmp_path / "feature-a"
+    metadata = make_metadata()
+    metadata.save(session_path)
+    with pytest.raises(ValueError, match="Invalid collaborator role"):
+        metadata.add_collaborator(session_path, "dev", role="admin")
+    assert metadata.collaborators == []
+    with pytest.raises(ValueError, match="Invalid status"):
+        metadata.update(session_path, status="bogus")
+
+
+def test_update_skips_noop_writes_and_saves_atomically(tmp_path: Path, make_metadata) -> None:
+    session_path = tmp_path / "feature-a"
+    make_metadata(tags=["auth"]).save(session_path)
+    metadata_file = session_path / "metadata" / "session.json"
+    before = metadata_file.read_bytes()
+
+    loaded = SessionMetadata.load(session_path)
+    loaded.update(session_path, status="draft")
+    loaded.remove_collaborator(session_path, "nobody")
+    loaded.add_tag(session_path, "auth")
+    assert metadata_file.read_bytes() == before
+    assert loaded.updated_at == "2026-02-01T00:00:00"
+
+    loaded.add_tag(session_path, "ui")
+    assert SessionMetadata.load(session_path).tags == ["auth", "ui"]
+    assert loaded.updated_at != "2026-02-01T00:00:00"
+    assert [p.name for p in (session_path / "metadata").iterdir()] == ["session.json"]
+
+
+def test_add_collaborator_shares_one_timestamp(tmp_path: Path, make_metadata) -> None:
+    session_path = tmp_path / "feature-a"
+    metadata = make_metadata()
+    metadata.save(session_path)
+
+    metadata.add_collaborator(session_path, "dev", role="reviewer")
+    assert metadata.collaborators[0].joined_at == metadata.updated_at
+
+
+def test_concurrent_saves_never_share_a_temp_file(tmp_path: Path, make_metadata) -> None:
+    session_path = tmp_path / "feature-a"
+    versions = [make_metadata(description=f"v{i}" * 2000) for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda metadata: [metadata.save(session_path) for _ in range(20)], versions))
+
+    assert SessionMetadata.load(session_path) in versions
+    assert [p.name for p in (session_path / "metadata").iterdir()] == ["session.json"]
@@ -0,0 +1,240 @@
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from idse_orchestrator import json_codec, session_graph, stage_state_model
+from idse_orchestrator.stage_state_model import StageStateModel, _file_contains
+
+
+def test_read_state_reuses_cache_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    tracker = StageStateModel(tmp_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+
+    reads = []
+    real_open = Path.open
+
+    def counting_open(self, mode="r", *args, **kwargs):
+        if self == tracker.state_file and mode == "rb":
+            reads.append(1)
+        return real_open(self, mode, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+
+    tracker.update_stage("intent", "completed")
+    tracker.update_stage("context", "in_progress")
+    assert reads == []
+
+    state = tracker._read_state()
+    state["stages"]["spec"] = "completed"
+    assert tracker._read_state()["stages"]["spec"] == "pending"
+
+    external = json.loads(tracker.state_file.read_text())
+    external["validation_status"] = "passing-externally"
+    tracker.state_file.write_text(json.dumps(external))
+    assert tracker._read_state()["validation_status"] == "passing-externally"
+    assert reads == [1]
+
+
+def test_batch_collapses_stage_updates_into_one_write(tmp_path: Path, monkeypatch) -> None:
+    tracker = StageStateModel(tmp_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+
+    writes = []
+    real_write = tracker._write_state_file
+    monkeypatch.setattr(tracker, "_write_state_file", lambda state: writes.append(1) or real_write(state))
+
+    with tracker.batch():
+        for stage in tracker.STAGE_NAMES:
+            tracker.update_stage(stage, "completed")
+        assert tracker.get_current_stage() is None
+        assert writes == []
+
+    assert writes == [1]
+    on_disk = json.loads(tracker.state_file.read_text())
+    assert set(on_disk["stages"].values()) == {"completed"}
+
+
+def test_batch_discards_pending_state_on_error(tmp_path: Path) -> None:
+    tracker = StageStateModel(tmp_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+
+    try:
+        with tracker.batch():
+            tracker.update_stage("intent", "completed")
+            tracker.update_stage("intent", "bogus")
+    except ValueError:
+        pass
+
+    assert tracker._read_state()["stages"]["intent"] == "pending"
+
+
+def test_mark_synced_records_iso_timestamp(tmp_path: Path) -> None:
+    tracker = StageStateModel(tmp_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+    before = datetime.now().replace(microsecond=0)
+    tracker.mark_synced()
+
+    last_sync = datetime.fromisoformat(tracker._read_state()["last_sync"])
+    assert before <= last_sync <= datetime.now()
+    tracker.mark_synced("2026-01-01T00:00:00")
+    assert tracker._read_state()["last_sync"] == "2026-01-01T00:00:00"
+
+
+def test_auto_detect_stage_completion_thresholds(tmp_path: Path) -> None:
+    tracker = StageStateModel(tmp_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+    session_path = tmp_path / "sessions" / "__blueprint__"
+    files = {
+        "intents/intent.md": "x" * 300,
+        "contexts/context.md": "x" * 150,
+        "specs/spec.md": "x" * 50,
+        "plans/plan.md": "x" * 100_000 + "[REQUIRES INPUT]",
+        # Thresholds count characters, not bytes: 300 and 120 bytes here.
+        "tasks/tasks.md": "é" * 150,
+        "feedback/feedback.md": "é" * 60,
+        "implementation/README.md": "€" * 201,
+    }
+    for rel, text in files.items():
+        (session_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (session_path / rel).write_text(text, encoding="utf-8")
+
+    tracker.auto_detect_stage_completion(session_path)
+    stages = tracker._read_state()["stages"]
+    assert stages["intent"] == "completed"
+    assert stages["context"] == "in_progress"
+    assert stages["spec"] == "pending"
+    assert stages["plan"] == "in_progress"
+    assert stages["tasks"] == "in_progress"
+    assert stages["feedback"] == "pending"
+    assert stages["implementation"] == "completed"
+
+    boundary = session_path / "boundary.md"
+    boundary.write_bytes(b"x" * 10 + b"[REQUIRES INPUT]")
+    assert _file_contains(boundary, b"[REQUIRES INPUT]", chunk_size=16)
+    assert not _file_contains(boundary, b"[MISSING]", chunk_size=16)
+
+
+def test_init_state_gives_each_session_its_own_stages(tmp_path: Path) -> None:
+    first = StageStateModel(tmp_path / "a").init_state("demo", "a")
+    first["stages"]["intent"] = "completed"
+    second = StageStateModel(tmp_path / "b").init_state("demo", "b")
+    assert second["stages"] == {stage: "pending" for stage in StageStateModel.STAGE_NAMES}
+
+
+def test_update_stage_rejects_unknown_stage_and_status(tmp_path: Path) -> None:
+    tracker = StageStateModel(tmp_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+    with pytest.raises(ValueError, match="Unknown stage"):
+        tracker.update_stage("deploy", "completed")
+    with pytest.raises(ValueError, match="Invalid status"):
+        tracker.update_stage("intent", "done")
+    tracker.update_stage("intent", "in_progress")
+    assert tracker.get_current_stage() == "intent"
+
+
+def test_state_file_is_replaced_atomically(tmp_path: Path) -> None:
+    tracker = StageStateModel(tmp_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+    inode = tracker.state_file.stat().st_ino
+    tracker.update_stage("intent", "completed")
+
+    assert tracker.state_file.stat().st_ino != inode
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["session_state.json"]
+    assert json.loads(tracker.state_file.read_bytes())["stages"]["intent"] == "completed"
+
+
+def test_concurrent_state_writes_use_separate_temp_files(tmp_path: Path) -> None:
+    StageStateModel(tmp_path).init_state("demo", "__blueprint__", is_blueprint=True)
+
+    def flip(stage: str) -> None:
+        tracker = StageStateModel(tmp_path)
+        for status in ("in_progress", "completed") * 10:
+            tracker.update_stage(stage, status)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(flip, ["intent", "context", "spec", "plan"]))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["session_state.json"]
+    assert json.loads(StageStateModel(tmp_path).state_file.read_bytes())["project_name"] == "demo"
+
+
+def test_read_state_parses_large_state_files(tmp_path: Path) -> None:
+    tracker = StageStateModel(tmp_path)
+    state = tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+    state["notes"] = ["n" * 100] * 100
+    tracker.state_file.write_bytes(json_codec.dumps(state))
+
+    assert tracker.state_file.stat().st_size > 4096
+    assert tracker._read_state() == state
+
+
+def test_resolve_session_id_looks_up_current_session_once(tmp_path: Path, monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(
+        session_graph.SessionGraph,
+        "get_current_session",
+        lambda self: calls.append(1) or None,
+    )
+
+    class Store:
+        def load_state(self, project):
+            return {"stages": {}}
+
+        def save_state(self, project, state):
+            pass
+
+    tracker = StageStateModel(tmp_path, store=Store(), project_name="demo")
+    tracker.set_validation_status("passing")
+    tracker.mark_synced()
+    assert tracker.session_id is None
+    assert calls == [1]
+
+
+def test_get_status_reads_state_or_reports_missing_file(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    tracker = StageStateModel(tmp_path / "demo")
+    state = tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+    assert tracker.get_status() == state
+
+    tracker.state_file.unlink()
+    with pytest.raises(FileNotFoundError, match="Run 'idse init' first"):
+        tracker.get_status("demo")
+
+
+def test_write_state_recreates_removed_project_directory(tmp_path: Path) -> None:
+    project_path = tmp_path / "projects" / "demo"
+    tracker = StageStateModel(project_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+
+    shutil.rmtree(project_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+    assert tracker._read_state()["session_id"] == "__blueprint__"
+
+
+def test_get_current_stage_tracks_writes_and_external_edits(tmp_path: Path) -> None:
+    tracker = StageStateModel(tmp_path)
+    tracker.init_state("demo", "__blueprint__", is_blueprint=True)
+    assert tracker.get_current_stage() == "intent"
+
+    tracker.update_stage("intent", "completed")
+    assert tracker.get_current_stage() == "context"
+
+    state = json.loads(tracker.state_file.read_text())
+    state["stages"] = dict.fromkeys(state["stages"], "completed")
+    tracker.state_file.write_text(json.dumps(state))
+    assert tracker.get_current_stage() is None
+
+
+def test_iso_now_refreshes_cached_second_as_one_pair(monkeypatch) -> None:
+    base = int(datetime(2026, 2, 1, 12, 0, 0).timestamp())
+    clock = iter([base * 10**9 + 5_000, base * 10**9 + 999_999_000, (base + 1) * 10**9])
+    monkeypatch.setattr(stage_state_model.time, "time_ns", lambda: next(clock))
+
+    assert stage_state_model._iso_now() == "2026-02-01T12:00:00.000005"
+    assert stage_state_model._iso_now() == "2026-02-01T12:00:00.999999"
+    assert stage_state_model._iso_now() == "2026-02-01T12:00:01.000000"
+    assert stage_state_model._ISO_SECOND == (base + 1, "2026-02-01T12:00:01")
@@ -0,0 +1,135 @@
+import random
+import re
+from pathlib import Path
+
+from idse_orchestrator.validation_engine import (
+    _SECTION_KEYS,
+    ValidationEngine,
+    _has_component_bullet,
+    _heading_text,
+)
+
+
+def test_strip_code_removes_fenced_blocks_and_inline_spans() -> None:
+    content = "Intro\n```python\nprint('[REQUIRES INPUT]')\n```\nUse `[REQUIRES INPUT]` literally.\nDone\n"
+    stripped = ValidationEngine()._strip_code(content)
+    assert "[REQUIRES INPUT]" not in stripped
+    assert "Intro" in stripped and "Done" in stripped
+    assert ValidationEngine()._strip_code("a `x` b ```\ny\n``` c `z`") == "a  b  c "
+    plain = "## Plan\n[REQUIRES INPUT]\n"
+    assert ValidationEngine()._strip_code(plain) is plain
+
+
+def test_heading_text_matches_per_section_search() -> None:
+    samples = [
+        "# Intent\n## purpose / goal\nbody mentions Vision\n",
+        "### Problem / Opportunity\n#x ## Stakeholders and Success Criteria\n",
+        "##\nVision statement\n",
+        "Vision\n## \n\n## Functional Requirements\n",
+        "#Purpose without space\n## System Overview",
+    ]
+    for content in samples:
+        headings = _heading_text(content)
+        for section, key in _SECTION_KEYS["intent.md"] + _SECTION_KEYS["spec.md"]:
+            expected = bool(re.search(rf"##?\s+.*{re.escape(section)}", content, re.IGNORECASE))
+            assert (key in headings) == expected, (content, section)
+
+
+def test_placeholders_in_reports_markers_in_declared_order() -> None:
+    engine = ValidationEngine()
+    content = "PrimitiveName for {{ stack }} at {{ project_name }}\n[Summary of implementation work]\n"
+    assert engine._placeholders_in(content) == [
+        "{{ project_name }}",
+        "{{ stack }}",
+        "[Summary of implementation work]",
+        "PrimitiveName",
+    ]
+    assert engine._placeholders_in("{{ other }} ExampleComponent") == ["ExampleComponent"]
+
+
+def _write_filesystem_session(tmp_path: Path, implementation: str) -> Path:
+    session_path = tmp_path / ".idse" / "projects" / "demo" / "sessions" / "__blueprint__"
+    files = {
+        "intents/intent.md": "## Problem / Opportunity\nx\n## Stakeholders\nx\n## Success Criteria\nx\n",
+        "contexts/context.md": "## Constraints\nx\n",
+        "specs/spec.md": "## Functional Requirements\nx\n",
+        "plans/plan.md": "## Plan\nx\n",
+        "tasks/tasks.md": "## Phase\nx\n",
+        "implementation/README.md": implementation,
+    }
+    for rel, text in files.items():
+        (session_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (session_path / rel).write_text(text)
+    (session_path.parent.parent / "CURRENT_SESSION").write_text("__blueprint__")
+    return session_path
+
+
+def test_validate_project_filesystem_reads_each_artifact_once(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    _write_filesystem_session(
+        tmp_path,
+        "## Component Impact Report\n- **ValidationEngine** (validation_engine.py)\n",
+    )
+    reads = []
+    real_read_text = Path.read_text
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **k: reads.append(self.name) or real_read_text(self, *a, **k))
+
+    results = ValidationEngine().validate_project("demo", backend_override="filesystem")
+
+    assert results["errors"] == ["feedback.md is missing"]
+    assert "implementation.md has component entries" in results["checks"]
+    assert "tasks.md has section: Phase" in results["checks"]
+    artifact_reads = [name for name in reads if name.endswith(".md")]
+    assert sorted(artifact_reads) == sorted(set(artifact_reads))
+
+
+def test_validate_project_filesystem_skips_exists_checks(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    session_path = _write_filesystem_session(tmp_path, "## Component Impact Report\n- **Engine** (x.py)\n")
+    probed = []
+    real_exists = Path.exists
+    monkeypatch.setattr(Path, "exists", lambda self, *a, **k: probed.append(self) or real_exists(self, *a, **k))
+
+    results = ValidationEngine().validate_project("demo", backend_override="filesystem")
+
+    assert "feedback.md is missing" in results["errors"]
+    assert not [path for path in probed if session_path in path.parents]
+    assert ValidationEngine()._get_artifact_path(session_path, "notes.md") == session_path / "notes.md"
+
+
+def test_has_component_bullet_matches_multiline_search() -> None:
+    reference = re.compile(r"^\s*-\s*\*\*[^*]+\*\*", re.MULTILINE)
+    pieces = ["-", " ", "\n", "**", "*", "a", "Name", "\t", "x - "]
+    rng = random.Random(7)
+    samples = ["a - **x\n- **y**", "  -  **Comp** (x)", "text - **not a bullet**", ""]
+    samples += ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 12))) for _ in range(2000)]
+    for content in samples:
+        assert _has_component_bullet(content) == bool(reference.search(content)), repr(content)
+
+
+def test_has_component_bullet_start_hint_keeps_whole_text_semantics() -> None:
+    heading = "## Component Impact Report\n"
+    before = "- **Early** (a.py)\n" + heading + "no entries\n"
+    after = "intro - **inline**\n" + heading + "- **Late** (b.py)\n"
+    neither = "intro - **inline**\n" + heading + "no entries\n"
+    for content, expected in ((before, True), (after, True), (neither, False)):
+        assert _has_component_bullet(content, content.find(heading)) is expected, repr(content)
+
+
+def test_validate_project_strips_code_only_for_marked_artifacts(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("IDSE_STORAGE_BACKEND", "filesystem")
+    session_path = _write_filesystem_session(tmp_path, "## Component Impact Report\n- **Engine** (x.py)\n")
+    (session_path / "specs" / "spec.md").write_text("## Purpose\n`[REQUIRES INPUT]` is the marker.\n")
+    (session_path / "plans" / "plan.md").write_text("## Plan\n[REQUIRES INPUT]\n")
+    stripped = []
+    real_strip = ValidationEngine._strip_code
+    monkeypatch.setattr(ValidationEngine, "_strip_code", lambda self, c: stripped.append(c) or real_strip(self, c))
+
+    results = ValidationEngine().validate_project("demo", backend_override="filesystem")
+
+    assert len(stripped) == 2
+    assert "spec.md has no [REQUIRES INPUT] markers" in results["checks"]
+    assert "plan.md contains [REQUIRES INPUT] markers" in results["errors"]